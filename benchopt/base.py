@@ -8,11 +8,16 @@ from .stopping_criterion import SufficientProgressCriterion
 
 from .utils.dynamic_modules import get_file_hash
 from .utils.dynamic_modules import _reconstruct_class
+from .utils.data_cache import get_data_key, load_data, save_data
 
 from .utils.dependencies_mixin import DependenciesMixin
 from .utils.parametrized_name_mixin import ParametrizedNameMixin
 
 
+# Last dataset reconstructed in this process, with its data.
+_LAST_DATASET = None
+
+
 class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
     """A base class for solver wrappers in BenchOpt.
 
@@ -43,6 +48,26 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
     - ``'tolerance'``: call the run method with tolerance deacreasing
       logarithmically to get more and more precise points.
 
+    With the ``'iteration'`` strategy, solvers that can resume from their
+    current state can set ``warm_start = True``. The run method is then called
+    with the number of iterations to perform on top of the previous call,
+    instead of restarting from scratch for each point of the curve. The state
+    of the solver should be initialized in ``set_objective``, which is called
+    before computing each curve. The time of each point accumulates the time
+    of the previous calls.
+
+    Solvers can set ``threads`` to the number of threads of the native thread
+    pools, such as BLAS or OpenMP, used by the run method. It overrides the
+    ``--n-threads`` option of ``benchopt run`` and can also be one of the
+    ``parameters`` to compare several values.
+
+    Solvers relying on a JIT compiler, such as numba, JAX or Julia, can
+    implement ``warmup(self)`` to trigger the compilation, for instance with
+    ``self.run(1)``. It is called after ``set_objective`` and before timing
+    each repetition, so the time of the first points of the curve does not
+    include the compilation. Its duration is stored in the ``compile_time``
+    column of the results.
+
     """
 
     _base_class_name = 'Solver'
@@ -50,6 +75,14 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
         strategy='iteration'
     )
 
+    # If True, run performs its iterations starting from the state reached by
+    # the previous call. Only used with the 'iteration' strategy.
+    warm_start = False
+
+    # Number of threads of the native thread pools used to run the solver. If
+    # None, use the number given to the runner.
+    threads = None
+
     @property
     def _solver_strategy(self):
         """ Change stop_strategy to stopping_strategy """
@@ -128,6 +161,14 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
         """
         ...
 
+    def warmup(self):
+        """Prepare the solver before the timed runs, e.g. JIT compilation.
+
+        This is called after ``set_objective``, before timing each
+        repetition. By default, it does nothing.
+        """
+        pass
+
     @abstractmethod
     def get_result(self):
         """Return the parameters computed by the previous run.
@@ -167,13 +208,13 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
 
         return False, None
 
-    # TODO: use this to allow parallel computation of the benchmark.
+    # Reduce the pickling and hashing burden by only pickling class parameters.
+    # This is also used to send the solver to workers for parallel runs.
     @staticmethod
-    def _reconstruct(module_filename, parameters, objective,
-                     pickled_module_hash=None):
-
+    def _reconstruct(module_filename, benchmark_dir, pickled_module_hash,
+                     parameters, objective):
         Solver = _reconstruct_class(
-            module_filename, 'Solver', pickled_module_hash
+            module_filename, 'Solver', benchmark_dir, pickled_module_hash
         )
         obj = Solver.get_instance(**parameters)
         obj._set_objective(objective)
@@ -181,8 +222,10 @@ class BaseSolver(ParametrizedNameMixin, DependenciesMixin, ABC):
 
     def __reduce__(self):
         module_hash = get_file_hash(self._module_filename)
-        return self._reconstruct, (self._module_filename, module_hash,
-                                   self._parameters, self._objective)
+        return self._reconstruct, (
+            self._module_filename, self._benchmark_dir, module_hash,
+            self._parameters, self._objective
+        )
 
 
 class CommandLineSolver(BaseSolver, ABC):
@@ -210,10 +253,17 @@ class BaseDataset(ParametrizedNameMixin, DependenciesMixin, ABC):
       and returns the ``dimension`` of the data as well as a dictionary
       containing the data. This dictionary is passed as arguments of the
       objective function method ``set_data``.
+
+    The data are only retrieved once per instance. If the runner sets a cache
+    folder, they are also stored on disk and loaded memory-mapped in the next
+    runs, see ``benchopt.utils.data_cache``.
     """
 
     _base_class_name = 'Dataset'
 
+    # Folder in which the data are cached on disk. If None, they are not.
+    _cache_dir = None
+
     @abstractmethod
     def get_data(self):
         """Return the problem's dimension as well as the objective parameters.
@@ -232,27 +282,56 @@ class BaseDataset(ParametrizedNameMixin, DependenciesMixin, ABC):
     def _get_data(self):
         "Wrapper to make sure the returned results are correctly formated."
 
+        # The data are loaded only once, e.g. for all the objectives.
+        if getattr(self, '_data', None) is not None:
+            return self._data
+
+        if self._cache_dir is not None:
+            key = get_data_key(self)
+            self._data = load_data(self._cache_dir, key)
+            if self._data is not None:
+                return self._data
+
         dimension, data = self.get_data()
 
         # Make sure dimension is a tuple
         if isinstance(dimension, numbers.Integral):
             dimension = (dimension,)
 
-        return dimension, data
+        self._data = dimension, data
+        if self._cache_dir is not None:
+            # Use the memory-mapped data, as in the next runs.
+            if save_data(self._cache_dir, key, dimension, data, str(self)):
+                self._data = load_data(self._cache_dir, key)
+        return self._data
 
     # Reduce the pickling and hashing burden by only pickling class parameters.
+    # When unpickled in a worker, the last dataset is kept with its data so
+    # it is only loaded once for all the units run on this dataset.
     @staticmethod
-    def _reconstruct(module_filename, pickled_module_hash, parameters):
+    def _reconstruct(module_filename, benchmark_dir, pickled_module_hash,
+                     parameters, cache_dir=None):
+        global _LAST_DATASET
+
+        key = (str(module_filename), pickled_module_hash, repr(parameters))
+        if _LAST_DATASET is not None and _LAST_DATASET[0] == key:
+            return _LAST_DATASET[1]
+
         Dataset = _reconstruct_class(
-            module_filename, 'Dataset', pickled_module_hash
+            module_filename, 'Dataset', benchmark_dir, pickled_module_hash
         )
         obj = Dataset.get_instance(**parameters)
+        obj._cache_dir = cache_dir
+        obj._get_data()
+        _LAST_DATASET = key, obj
         return obj
 
     def __reduce__(self):
         module_hash = get_file_hash(self._module_filename)
-        return self._reconstruct, (self._module_filename, module_hash,
-                                   self._parameters)
+        return self._reconstruct, (
+            self._module_filename, self._benchmark_dir, module_hash,
+            self._parameters, self._cache_dir
+        )
 
 
 class BaseObjective(ParametrizedNameMixin, DependenciesMixin):
@@ -276,6 +355,10 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin):
       `value` associated to a scalar value which will be used to
       detect convergence. With a dictionary, multiple metric values can be
       stored at once instead of runnning each separately.
+
+    Objectives can also implement `compute_batch(betas)` to compute the
+    objective for several estimates at once, for instance with a single matrix
+    product. It is used when the iterates are evaluated after being stored.
     """
 
     _base_class_name = 'Objective'
@@ -324,13 +407,42 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin):
         """
         ...
 
+    def compute_batch(self, betas):
+        """Compute the value of the objective for several estimates.
+
+        By default, this calls ``compute`` on each estimate. It can be
+        overriden to compute all the values at once, e.g. with a single
+        matrix product instead of one matrix-vector product per estimate.
+
+        Parameters
+        ----------
+        betas : ndarray, shape ``(n_betas, *dimension)`` or list
+            The estimates of the parameters being optimized. When the
+            estimates are arrays, they are stacked in a single array.
+
+        Returns
+        -------
+        objective_values : list of float or dict {'name': float}
+            The output of ``compute`` for each estimate.
+        """
+        return [self.compute(beta) for beta in betas]
+
     def __call__(self, beta):
         """Used to call the computation of the objective.
 
         This allow to standardize the output to a dictionary.
         """
-        objective_dict = self.compute(beta)
+        return self._format_output(self.compute(beta))
+
+    def _call_batch(self, betas):
+        "Call the computation of the objective for several estimates."
+        return [
+            self._format_output(objective_dict)
+            for objective_dict in self.compute_batch(betas)
+        ]
 
+    def _format_output(self, objective_dict):
+        "Standardize the output of the objective to a dictionary."
         if not isinstance(objective_dict, dict):
             objective_dict = {'value': objective_dict}
 
@@ -377,10 +489,10 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin):
 
     # Reduce the pickling and hashing burden by only pickling class parameters.
     @staticmethod
-    def _reconstruct(module_filename, pickled_module_hash, parameters,
-                     dataset):
+    def _reconstruct(module_filename, benchmark_dir, pickled_module_hash,
+                     parameters, dataset):
         Objective = _reconstruct_class(
-            module_filename, 'Objective', pickled_module_hash
+            module_filename, 'Objective', benchmark_dir, pickled_module_hash
         )
         obj = Objective.get_instance(**parameters)
         obj.set_dataset(dataset)
@@ -388,5 +500,7 @@ class BaseObjective(ParametrizedNameMixin, DependenciesMixin):
 
     def __reduce__(self):
         module_hash = get_file_hash(self._module_filename)
-        return self._reconstruct, (self._module_filename, module_hash,
-                                   self._parameters, self._dataset)
+        return self._reconstruct, (
+            self._module_filename, self._benchmark_dir, module_hash,
+            self._parameters, self._dataset
+        )
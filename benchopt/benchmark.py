@@ -4,8 +4,11 @@ import warnings
 from pathlib import Path
 
 from .config import get_setting
+from .constants import OUTPUT_FORMATS
 from .base import BaseSolver, BaseDataset
 from .utils.colorify import colorify, YELLOW
+from .utils.results import list_result_files
+from .utils.results import get_latest_results_file
 from .utils.safe_import import set_benchmark
 from .utils.dynamic_modules import _load_class_from_module
 from .utils.parametrized_name_mixin import product_param
@@ -37,8 +40,15 @@ class Benchmark:
     @property
     def mem(self):
         from joblib import Memory
+        from .utils.store_backends import get_run_cache_backend
         if not hasattr(self, '_mem'):
-            self._mem = Memory(location=self.get_cache_location(), verbose=0)
+            location = self.get_setting('run_cache')
+            if location is None:
+                location = self.get_cache_location()
+            self._mem = Memory(
+                location=location, verbose=0,
+                backend=get_run_cache_backend(location)
+            )
         return self._mem
 
     def get_setting(self, setting_name):
@@ -121,8 +131,15 @@ class Benchmark:
 
     def get_cache_location(self):
         "Get the location for the cache of the benchmark."
+        cache_location = self.get_setting('cache_location')
+        if cache_location is not None:
+            return Path(cache_location).expanduser()
         return self.benchmark_dir / CACHE_DIR
 
+    def get_dataset_cache_location(self):
+        "Get the location for the cached data of the benchmark's datasets."
+        return self.get_cache_location() / 'datasets'
+
     def get_config_file(self):
         "Get the location for the config file of the benchmark."
         return self.benchmark_dir / 'config.ini'
@@ -155,36 +172,45 @@ class Benchmark:
         ----------
         filename : str
             Select a specific file from the benchmark. If None, this will
-            select the most recent CSV file in the benchmark output folder.
+            select the most recent result file in the benchmark output
+            folder. The result files can be in any of the OUTPUT_FORMATS.
         """
         # List all result files
         output_folder = self.get_output_folder()
-        all_csv_files = output_folder.glob("*.csv")
-        all_csv_files = sorted(
-            all_csv_files, key=lambda t: t.stat().st_mtime
+        all_result_files = sorted(
+            list_result_files(output_folder), key=lambda t: t.stat().st_mtime
         )
 
         if filename is not None and filename != 'all':
-            result_filename = (output_folder / filename).with_suffix('.csv')
-            if not result_filename.exists():
+            result_filename = output_folder / filename
+            if result_filename.suffix[1:] not in OUTPUT_FORMATS:
+                # Look for a result file with this name in any format.
+                candidates = [
+                    result_filename.with_suffix(f'.{output_format}')
+                    for output_format in OUTPUT_FORMATS
+                ]
+                result_filename = next(
+                    (f for f in candidates if f.exists()), candidates[0]
+                )
+            if not get_latest_results_file(result_filename).exists():
                 if Path(filename).exists():
                     result_filename = Path(filename)
                 else:
-                    all_csv_files = '\n- '.join([
-                        str(s) for s in all_csv_files
+                    all_result_files = '\n- '.join([
+                        str(s) for s in all_result_files
                     ])
                     raise FileNotFoundError(
                         f"Could not find result file {filename}. Available "
-                        f"result files are:\n- {all_csv_files}"
+                        f"result files are:\n- {all_result_files}"
                     )
         else:
-            if len(all_csv_files) == 0:
+            if len(all_result_files) == 0:
                 raise RuntimeError(
-                    f"Could not find any CSV result files in {output_folder}."
+                    f"Could not find any result files in {output_folder}."
                 )
-            result_filename = all_csv_files[-1]
+            result_filename = all_result_files[-1]
             if filename == 'all':
-                result_filename = all_csv_files
+                result_filename = all_result_files
 
         return result_filename
 
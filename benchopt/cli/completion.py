@@ -79,8 +79,8 @@ def complete_output_files(ctx, param, incomplete):
     benchmark = find_benchmark_in_args(ctx.args)
     if benchmark is None:
         return []
-    output_folder = benchmark.get_output_folder()
-    candidates = list(output_folder.glob('*.csv'))
+    from benchopt.utils.results import list_result_files
+    candidates = list_result_files(benchmark.get_output_folder())
     return propose_from_list(candidates, incomplete)
 
 
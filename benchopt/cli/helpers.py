@@ -1,6 +1,8 @@
+import time
 import click
 import pprint
 from pathlib import Path
+from collections import defaultdict
 from collections.abc import Iterable
 import warnings
 
@@ -8,6 +10,9 @@ from benchopt.config import set_setting
 from benchopt.config import get_setting
 from benchopt.benchmark import Benchmark
 from benchopt.utils.files import rm_folder
+from benchopt.utils.cache_manager import prune_cache
+from benchopt.utils.cache_manager import parse_size, format_size
+from benchopt.utils.cache_manager import list_cache_entries
 from benchopt.utils.sys_info import get_sys_info
 from benchopt.cli.completion import complete_benchmarks
 from benchopt.cli.completion import complete_conda_envs
@@ -47,6 +52,97 @@ def clean(benchmark, token=None, filename=None):
     rm_folder(cache_folder)
 
 
+@helpers.group(
+    help="Inspect and prune the cache of a benchmark."
+)
+def cache():
+    pass
+
+
+@cache.command(
+    name='info',
+    help="Show the size of the cache of a benchmark, by solver and dataset."
+)
+@click.argument('benchmark', type=click.Path(exists=True),
+                shell_complete=complete_benchmarks)
+def cache_info(benchmark):
+    benchmark = Benchmark(benchmark)
+    entries = list_cache_entries(benchmark.get_cache_location())
+    total_size = sum(entry['size'] for entry in entries)
+    max_size = benchmark.get_setting('cache_max_size')
+    print(f"Cache of benchmark '{benchmark.name}': "
+          f"{benchmark.get_cache_location()}")
+    print(f"{len(entries)} entries, {format_size(total_size)} "
+          f"(max size: {max_size or 'not set'})")
+
+    for key in ['solver', 'dataset']:
+        usage = defaultdict(int)
+        for entry in entries:
+            if key == 'solver' and entry['kind'] == 'dataset':
+                continue
+            usage[entry[key] or 'unknown'] += entry['size']
+        if len(usage) == 0:
+            continue
+        print(f"By {key}:")
+        for name, size in sorted(usage.items(), key=lambda x: -x[1]):
+            print(f"  {format_size(size):>9}  {name}")
+
+
+@cache.command(
+    name='ls',
+    help="List the entries of the cache of a benchmark, from the least to "
+    "the most recently used."
+)
+@click.argument('benchmark', type=click.Path(exists=True),
+                shell_complete=complete_benchmarks)
+def cache_ls(benchmark):
+    benchmark = Benchmark(benchmark)
+    for entry in list_cache_entries(benchmark.get_cache_location()):
+        last_access = time.strftime(
+            '%Y-%m-%d %H:%M', time.localtime(entry['last_access'])
+        )
+        description = ' '.join(
+            str(entry[k]) for k in ['function', 'solver', 'dataset']
+            if entry[k] is not None
+        )
+        print(f"{last_access}  {format_size(entry['size']):>9}  "
+              f"{entry['kind']:<7}  {description}")
+
+
+@cache.command(
+    name='prune',
+    help="Remove the least recently used entries of the cache of a "
+    "benchmark. Without option, the cache is reduced to the size set with "
+    "the `cache_max_size` setting of the benchmark."
+)
+@click.argument('benchmark', type=click.Path(exists=True),
+                shell_complete=complete_benchmarks)
+@click.option('--max-size', metavar='<size>', type=str, default=None,
+              help="Remove entries until the cache is smaller than <size>, "
+              "e.g. `10GB` or `500M`.")
+@click.option('--max-age', metavar='<days>', type=float, default=None,
+              help="Remove the entries not used for more than <days> days.")
+def cache_prune(benchmark, max_size=None, max_age=None):
+    benchmark = Benchmark(benchmark)
+    if max_size is None:
+        max_size = benchmark.get_setting('cache_max_size')
+    if max_size is None and max_age is None:
+        raise click.UsageError(
+            "Give --max-size or --max-age, or set `cache_max_size` in the "
+            "benchmark config."
+        )
+    try:
+        max_size = None if max_size is None else parse_size(max_size)
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    removed = prune_cache(
+        benchmark.get_cache_location(), max_size=max_size, max_age=max_age
+    )
+    freed = sum(entry['size'] for entry in removed)
+    print(f"Removed {len(removed)} entries, {format_size(freed)} freed.")
+
+
 def check_conda_env(env_name, benchmark_name=None):
     """Return name of valid and existing conda environment.
 
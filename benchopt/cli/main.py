@@ -3,10 +3,16 @@ import warnings
 from pathlib import Path
 
 from benchopt.benchmark import Benchmark
+from benchopt.constants import BACKENDS
+from benchopt.constants import SAMPLINGS
+from benchopt.constants import EVAL_MODES
+from benchopt.constants import ISOLATIONS
+from benchopt.constants import OUTPUT_FORMATS
 from benchopt.cli.completion import complete_solvers
 from benchopt.cli.completion import complete_datasets
 from benchopt.cli.completion import complete_benchmarks
 from benchopt.cli.completion import complete_conda_envs
+from benchopt.cli.completion import complete_output_files
 from benchopt.utils.conda_env_cmd import list_conda_envs
 from benchopt.utils.conda_env_cmd import create_conda_env
 from benchopt.utils.shell_cmd import _run_shell_in_conda_env
@@ -14,6 +20,18 @@ from benchopt.utils.conda_env_cmd import get_benchopt_version_in_env
 from benchopt.utils.profiling import print_stats
 
 
+def _parse_int_list(ctx, param, value):
+    "Parse a comma separated list of integers, such as 1,2,4."
+    if value is None:
+        return None
+    try:
+        return [int(v) for v in value.split(',')]
+    except ValueError:
+        raise click.BadParameter(
+            f"should be a comma separated list of integers. Got '{value}'."
+        )
+
+
 main = click.Group(
     name='Principal Commands',
     help="Principal commands that are used in ``benchopt``."
@@ -65,6 +83,94 @@ main = click.Group(
 @click.option('--timeout',
               metavar="<int>", default=100, show_default=True, type=int,
               help='Timeout a solver when run for more than <timeout> seconds')
+@click.option('--total-timeout',
+              metavar="<int>", default=None, type=int,
+              help='Maximal duration in seconds of the whole benchmark. The '
+              'time left is shared equally between the (dataset, objective, '
+              'solver) that remain to be run, so the time not used by solvers '
+              'converging early is given to the next ones. Results of the '
+              'solvers stopped by this budget are flagged in the '
+              '`budget_truncated` column.')
+@click.option('--n-jobs', '-j',
+              metavar="<int>", default=1, show_default=True, type=int,
+              help='Maximal number of workers to run the benchmark in '
+              'parallel. Each (dataset, objective, solver) is run in a '
+              'separate worker process.')
+@click.option('--backend',
+              default='loky', show_default=True, type=click.Choice(BACKENDS),
+              help='Executor used to run the benchmark in parallel when '
+              '`--n-jobs` is larger than 1. `loky` and `multiprocessing` use '
+              'a local process pool while `dask` starts a local dask cluster '
+              'and requires `distributed` to be installed.')
+@click.option('--output-format',
+              default='csv', show_default=True,
+              type=click.Choice(OUTPUT_FORMATS),
+              help='Format of the result file. The columnar formats '
+              '`parquet` and `feather` are faster to load for large results '
+              'and require `pyarrow` to be installed.')
+@click.option('--resume', metavar='<result_file>', type=str, default=None,
+              shell_complete=complete_output_files,
+              help='Resume an interrupted run from its result file, either '
+              'a path or a file name in the benchmark output folder. The '
+              'repetitions of each (dataset, objective, solver) already in '
+              'the file are skipped and the new results are appended to it.')
+@click.option('--eval-mode',
+              default='sync', show_default=True, type=click.Choice(EVAL_MODES),
+              help='How the objective is evaluated for solvers using a '
+              'callback. With `sync`, it is evaluated in the callback. With '
+              '`deferred`, the callback only stores a copy of the iterates, '
+              'which are evaluated by batches, so the solver is not stalled '
+              'by expensive objectives. With `thread`, the copies are '
+              'evaluated by a worker thread while the solver runs.')
+@click.option('--sampling',
+              default='geometric', show_default=True,
+              type=click.Choice(SAMPLINGS),
+              help='How the points of the curves are spaced. With '
+              '`geometric`, the number of iterations or the tolerance change '
+              'geometrically between two points. With `time`, the number of '
+              'iterations is chosen to space the points log-uniformly in time '
+              'until the timeout, so each solver uses about <max_runs> points '
+              'whatever its speed.')
+@click.option('--isolation',
+              default='none', show_default=True,
+              type=click.Choice(ISOLATIONS),
+              help='Where the solvers are run. With `none`, they are run in '
+              'the main process and a solver that never returns blocks the '
+              'benchmark. With `repetition`, each repetition is run in a new '
+              'process, which is killed when the solver times out. The '
+              'results obtained before the timeout are kept. With `solver`, '
+              'each solver class is run in its own long-lived process, which '
+              'serves all its runs, so the solvers do not share thread pools '
+              'or caches.')
+@click.option('--n-threads',
+              metavar="<int>", default=None, type=int,
+              help='Maximal number of threads used by the BLAS and OpenMP '
+              'thread pools when running the solvers. Solvers can override '
+              'it with their `threads` attribute. The numbers of threads '
+              'actually used are stored in the results.')
+@click.option('--pin-cpus',
+              is_flag=True,
+              help='Pin each solver to a block of CPUs not used by the other '
+              'solvers running at the same time. The CPUs are split in '
+              '<n_jobs> blocks. Only available on Linux.')
+@click.option('--scaling-threads',
+              metavar='<n_1,n_2,...>', default=None, type=str,
+              callback=_parse_int_list,
+              help='Run each solver once for each of these numbers of '
+              'threads, e.g. `1,2,4,8`, to measure how it scales. The number '
+              'of threads is added to the solver names and the '
+              '`scaling_curve` plot shows the speedup and parallel '
+              'efficiency of each solver.')
+@click.option('--warmup', 'n_warmup',
+              metavar='<int>', default=0, show_default=True, type=int,
+              help='Number of untimed runs of the solvers before timing each '
+              'point of the curves, to exclude JIT compilation and cold '
+              'caches from the timings.')
+@click.option('--trials', 'n_trials',
+              metavar='<int>', default=1, show_default=True, type=int,
+              help='Number of timed runs of the solvers for each point of the '
+              'curves. The median time is reported, with its minimum, its '
+              'median absolute deviation and the number of outlier trials.')
 @click.option('--plot/--no-plot', default=True,
               help="Whether or not to plot the results. Default is True.")
 @click.option('--html/--no-html', default=True,
@@ -96,8 +202,12 @@ main = click.Group(
               "datasets, see the command `benchopt install`.")
 def run(benchmark, solver_names, forced_solvers, dataset_names,
         objective_filters, max_runs, n_repetitions, timeout,
-        plot=True, html=True, pdb=False, do_profile=False,
-        env_name='False', old_objective_filters=None):
+        total_timeout=None, n_jobs=1, backend='loky', output_format='csv',
+        resume=None, eval_mode='sync', sampling='geometric',
+        isolation='none', n_threads=None, pin_cpus=False,
+        scaling_threads=None, n_warmup=0, n_trials=1, plot=True, html=True,
+        pdb=False, do_profile=False, env_name='False',
+        old_objective_filters=None):
     if len(old_objective_filters):
         warnings.warn(
             'Using the -p option is deprecated, use -o instead',
@@ -116,6 +226,8 @@ def run(benchmark, solver_names, forced_solvers, dataset_names,
     benchmark.validate_dataset_patterns(dataset_names)
     benchmark.validate_solver_patterns(solver_names+forced_solvers)
     benchmark.validate_objective_filters(objective_filters)
+    if resume is not None:
+        resume = benchmark.get_result_file(resume)
 
     # If env_name is False, the flag `--local` has been used (default) so
     # run in the current environement.
@@ -125,7 +237,13 @@ def run(benchmark, solver_names, forced_solvers, dataset_names,
             dataset_names=dataset_names,
             objective_filters=objective_filters,
             max_runs=max_runs, n_repetitions=n_repetitions,
-            timeout=timeout, plot_result=plot, html=html, pdb=pdb
+            timeout=timeout, total_timeout=total_timeout,
+            n_jobs=n_jobs, backend=backend,
+            output_format=output_format, resume=resume, eval_mode=eval_mode,
+            sampling=sampling, isolation=isolation, n_threads=n_threads,
+            pin_cpus=pin_cpus, scaling_threads=scaling_threads,
+            n_warmup=n_warmup, n_trials=n_trials, plot_result=plot,
+            html=html, pdb=pdb
         )
 
         print_stats()  # print profiling stats (does nothing if not profiling)
@@ -170,10 +288,29 @@ def run(benchmark, solver_names, forced_solvers, dataset_names,
     forced_solvers_option = ' '.join([f"-f '{s}'" for s in forced_solvers])
     datasets_option = ' '.join([f"-d '{d}'" for d in dataset_names])
     objective_option = ' '.join([f"-p '{p}'" for p in objective_filters])
+    resume_option = f"--resume '{resume}'" if resume is not None else ''
+    total_timeout_option = (
+        f"--total-timeout {total_timeout}" if total_timeout is not None
+        else ''
+    )
+    n_threads_option = (
+        f"--n-threads {n_threads}" if n_threads is not None else ''
+    )
+    scaling_threads_option = (
+        f"--scaling-threads {','.join(map(str, scaling_threads))}"
+        if scaling_threads is not None else ''
+    )
     cmd = (
         rf"benchopt run --local {benchmark.benchmark_dir} "
         rf"--n-repetitions {n_repetitions} "
         rf"--max-runs {max_runs} --timeout {timeout} "
+        rf"{total_timeout_option} "
+        rf"--n-jobs {n_jobs} --backend {backend} "
+        rf"--output-format {output_format} "
+        rf"{resume_option} --eval-mode {eval_mode} --sampling {sampling} "
+        rf"--isolation {isolation} {n_threads_option} "
+        rf"{'--pin-cpus' if pin_cpus else ''} {scaling_threads_option} "
+        rf"--warmup {n_warmup} --trials {n_trials} "
         rf"{solvers_option} {forced_solvers_option} "
         rf"{datasets_option} {objective_option} "
         rf"{'--plot' if plot else '--no-plot'} "
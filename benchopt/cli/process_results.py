@@ -100,6 +100,12 @@ def publish(benchmark, token=None, filename=None):
     from benchopt.utils.github import publish_result_file
     publish_result_file(benchmark.name, result_filename, token)
 
+    # Publish the run metadata, which contain the system info, if any.
+    from benchopt.utils.results import get_metadata_file
+    metadata_file = get_metadata_file(result_filename)
+    if metadata_file.exists():
+        publish_result_file(benchmark.name, metadata_file, token)
+
 
 @process_results.command(
     help="Generate result website from list of benchmarks."
@@ -36,7 +36,13 @@ DEFAULT_GLOBAL_CONFIG = {
 """
 
 DEFAULT_BENCHMARK_CONFIG = {
-    'plots': list(PLOT_KINDS),
+    # The scaling curve is only meaningful for runs with --scaling-threads,
+    # for which it is always displayed.
+    'plots': [kind for kind in PLOT_KINDS if kind != 'scaling_curve'],
+    'cache_datasets': False,
+    'cache_max_size': None,
+    'cache_location': None,
+    'run_cache': None,
 }
 """
 * ``plots``, *list*: Select the plots to display for the benchmark. Should be
@@ -48,6 +54,27 @@ DEFAULT_BENCHMARK_CONFIG = {
     plots =
         suboptimality_curve
         histogram
+
+* ``cache_datasets``, *boolean*: If set to true, the data of the datasets are
+  stored in the benchmark cache folder the first time they are retrieved, and
+  loaded memory-mapped from there in the next runs. The cache is invalidated
+  when the dataset module or parameters change, but not when the modules it
+  imports or the files it reads change, and random datasets are frozen to
+  their first draw. Remove the ``datasets`` folder of the cache to retrieve
+  the data again. Defaults to false: the data are retrieved at each run and
+  only shared with the workers through a temporary folder.
+* ``cache_max_size``, *str*: Maximal size of the benchmark cache folder, as
+  ``10GB`` or ``500M``. After each run, the least recently used entries of
+  the cache are removed until it fits. If not set (default), the cache is
+  not bounded. See also ``benchopt cache prune``.
+* ``cache_location``, *str*: Folder of the benchmark cache. It defaults to
+  the ``__cache__`` folder of the benchmark and can be set to a shared file
+  system, so several machines reuse the same cached runs and datasets.
+* ``run_cache``, *str*: If set to an URL ``s3://<bucket>/<prefix>``, the runs
+  are cached in this bucket of an S3-compatible object store, which requires
+  ``boto3``. The endpoint of the store, e.g. a MinIO server, is set with the
+  ``AWS_ENDPOINT_URL`` environment variable. The datasets are still cached in
+  the cache folder.
 """
 
 
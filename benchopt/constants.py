@@ -2,5 +2,21 @@ PLOT_KINDS = {
     'objective_curve': 'plot_objective_curve',
     'suboptimality_curve': 'plot_suboptimality_curve',
     'relative_suboptimality_curve': 'plot_relative_suboptimality_curve',
-    'histogram': 'plot_histogram'
+    'histogram': 'plot_histogram',
+    'scaling_curve': 'plot_scaling_curve'
 }
+
+# Executors that can be used to run the benchmark in parallel
+BACKENDS = ('loky', 'multiprocessing', 'dask')
+
+# File formats that can be used to save the results of a run
+OUTPUT_FORMATS = ('csv', 'parquet', 'feather')
+
+# How the objective is evaluated for solvers with the callback strategy
+EVAL_MODES = ('sync', 'deferred', 'thread')
+
+# How the stop values of the solvers are spaced along the curve
+SAMPLINGS = ('geometric', 'time')
+
+# Where the solvers are run, so they can be killed when they time out
+ISOLATIONS = ('none', 'repetition', 'solver')
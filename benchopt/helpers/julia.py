@@ -53,6 +53,12 @@ class JuliaSolver(BaseSolver):
     install_cmd = 'conda'
     requirements = ['julia', 'pip:julia']
 
+    def warmup(self):
+        # The first call to a Julia function includes its compilation. Run
+        # the solver once with a cheap stop_val, so it is not timed.
+        if self._solver_strategy != 'callback':
+            self.run(1)
+
     @classmethod
     def is_installed(cls, env_name=None, raise_on_not_installed=None):
         success = super().is_installed(
@@ -1,13 +1,14 @@
 import itertools
-import pandas as pd
 import matplotlib.pyplot as plt
 
 from ..constants import PLOT_KINDS
+from ..utils.results import load_results
 from .helpers import get_plot_id
 from .plot_histogram import plot_histogram  # noqa: F401
 from .plot_objective_curve import plot_objective_curve  # noqa: F401
 from .plot_objective_curve import plot_suboptimality_curve  # noqa: F401
 from .plot_objective_curve import plot_relative_suboptimality_curve  # noqa: F401 E501
+from .plot_scaling_curve import plot_scaling_curve  # noqa: F401
 from .generate_html import plot_benchmark_html
 
 
@@ -49,7 +50,7 @@ def plot_benchmark(fname, benchmark, kinds=None, display=True, plotly=False,
 
     else:
         # Load the results.
-        df = pd.read_csv(fname)
+        df = load_results(fname)
         obj_cols = [
             k for k in df.columns
             if k.startswith('objective_') and k != 'objective_name'
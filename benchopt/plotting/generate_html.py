@@ -10,10 +10,14 @@ import matplotlib.pyplot as plt
 from mako.template import Template
 
 from ..constants import PLOT_KINDS
+from ..utils.results import load_results
+from ..utils.results import list_result_files
+from ..utils.results import get_metadata_file
 from .plot_histogram import plot_histogram  # noqa: F401
 from .plot_objective_curve import plot_objective_curve  # noqa: F401
 from .plot_objective_curve import plot_suboptimality_curve  # noqa: F401
 from .plot_objective_curve import plot_relative_suboptimality_curve  # noqa: F401 E501
+from .plot_scaling_curve import plot_scaling_curve  # noqa: F401
 
 
 ROOT = Path(__file__).parent / "html"
@@ -148,12 +152,12 @@ def export_figure(fig, fig_name, fig_dir):
 
 
 def get_results(fnames, kinds, root_html, benchmark_name, copy=False):
-    """Generate figures from a list of csv files.
+    """Generate figures from a list of result files.
 
     Parameters
     ----------
     fnames : list of Path
-        list of csv files containing the benchmark results.
+        list of result files containing the benchmark results.
     kinds : list of str
         List of the kind of plots that will be generated. This needs to be a
         sub-list of PLOT_KINDS.keys().
@@ -178,13 +182,19 @@ def get_results(fnames, kinds, root_html, benchmark_name, copy=False):
     for fname in fnames:
         print(f"Processing {fname}")
 
-        df = pd.read_csv(fname)
+        df = load_results(fname)
         datasets = list(df['data_name'].unique())
         sysinfo = get_sysinfo(df)
-        # Copy CSV if necessary and give a relative path for HTML page access
+        # Copy result file and its metadata if necessary and give a relative
+        # path for HTML page access
         if copy:
             fname_in_output = out_dir / f"{benchmark_name}_{fname.name}"
             shutil.copy(fname, fname_in_output)
+            metadata_file = get_metadata_file(fname)
+            if metadata_file.exists():
+                shutil.copy(
+                    metadata_file, get_metadata_file(fname_in_output)
+                )
             fname = fname_in_output
         fname = fname.relative_to(root_html)
 
@@ -200,7 +210,7 @@ def get_results(fnames, kinds, root_html, benchmark_name, copy=False):
     for result in results:
         result['page'] = (
             f"{benchmark_name}_"
-            f"{result['fname_short'].replace('.csv', '.html')}"
+            f"{Path(result['fname_short']).with_suffix('.html')}"
         )
 
     return results
@@ -229,21 +239,29 @@ def get_sysinfo(df):
         Contains the three-level sytem informations.
     """
 
+    # The system info are stored once in the run metadata. Result files from
+    # older versions of benchopt store them in the columns of each row.
+    metadata = df.attrs.get('sys_info', {})
+
     def get_val(df, key):
-        if key in df:
-            if key == 'platform':
-                return (
-                    df["platform"].unique()[0] +
-                    df["platform-release"].unique()[0] + "-" +
-                    df["platform-architecture"].unique()[0]
-                )
-            else:
-                val = df[key].unique()[0]
-                if not pd.isnull(val):
-                    return str(val)
-                return ''
+        if key in metadata:
+            # JSON stores tuples as lists, display them as in older files.
+            val = metadata[key]
+            if isinstance(val, list):
+                val = tuple(val)
+        elif key in df:
+            val = df[key].unique()[0]
         else:
             return ''
+        if pd.isnull(val):
+            return ''
+        if key == 'platform':
+            return (
+                str(val) + get_val(df, "platform-release") + "-" +
+                get_val(df, "platform-architecture")
+            )
+        return str(val)
+
     sysinfo = {
         level: {name: get_val(df, key) for key, name in keys}
         for level, keys in SYS_INFO.items()
@@ -494,7 +512,7 @@ def plot_benchmark_html_all(patterns=(), benchmarks=(), root=None,
 
         fnames = []
         for p in patterns:
-            fnames += (benchmark / 'outputs').glob(f"{p}.csv")
+            fnames += list_result_files(benchmark / 'outputs', p)
         fnames = sorted(set(fnames))
         results = get_results(
             fnames, PLOT_KINDS.keys(), root_html, benchmark.name, copy=True
@@ -0,0 +1,144 @@
+import numpy as np
+import matplotlib.pyplot as plt
+
+from .helpers import _color_palette
+from .helpers_compat import get_figure
+
+try:
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+except ImportError:
+    go = None
+
+# Suffix added to the solver names by `benchopt run --scaling-threads`.
+THREADS_SUFFIX = r' \(threads=\d+\)$'
+
+
+def _get_scaling_times(df, obj_col, eps=1e-6):
+    """Compute the time to reach a common precision for each thread count.
+
+    The precision is the best objective value reached with all the numbers of
+    threads. The time is the median over the repetitions of the time of the
+    first stop_val reaching this precision, or NaN if it is not reached.
+    """
+    c_star = df.groupby('n_threads')[obj_col].min().max() + eps
+
+    n_threads, times = [], []
+    for n, df_n in df.groupby('n_threads'):
+        df_tol = df_n.groupby('stop_val').filter(
+            lambda x: x[obj_col].max() < c_star)
+        n_threads.append(n)
+        if df_tol.empty:
+            times.append(np.nan)
+            continue
+        stop_val = df_tol['stop_val'].min()
+        times.append(df_n[df_n['stop_val'] == stop_val]['time'].median())
+    return np.array(n_threads), np.array(times)
+
+
+def plot_scaling_curve(df, obj_col='objective_value', plotly=False):
+    """Plot the speedup and parallel efficiency of the solvers.
+
+    The results should come from ``benchopt run --scaling-threads``. For each
+    solver, the speedup with ``n`` threads is the time to reach the precision
+    reached with all the numbers of threads, with the smallest number of
+    threads ``n_0``, divided by this time with ``n`` threads. The parallel
+    efficiency is the speedup divided by ``n / n_0``.
+
+    Parameters
+    ----------
+    df : instance of pandas.DataFrame
+        The benchmark results.
+    obj_col : str
+        Column to select in the DataFrame for the plot.
+    plotly : bool
+        If set to True, output a plotly figure for HTML display.
+
+    Returns
+    -------
+    fig : matplotlib.Figure or pyplot.Figure
+        The rendered figure, used to create HTML reports.
+    """
+    dataset_name = df['data_name'].unique()[0]
+    objective_name = df['objective_name'].unique()[0]
+    title = f"{objective_name}\nData: {dataset_name}"
+
+    if 'n_threads' not in df.columns or df['n_threads'].count() == 0:
+        fig = get_figure(plotly)
+        text = "Not Available, run with --scaling-threads"
+        if plotly:
+            fig.add_annotation(text=text,
+                               xref="paper", yref="paper",
+                               x=0.5, y=0.5, showarrow=False,
+                               font=dict(color="black", size=24))
+        else:
+            plt.text(0.5, 0.5, text, ha='center')
+        return fig
+
+    df = df[df['n_threads'].notna()]
+    solver_names = df['solver_name'].str.replace(
+        THREADS_SUFFIX, '', regex=True
+    )
+    colors = _color_palette(solver_names.nunique())
+    n_threads_all = np.sort(df['n_threads'].unique())
+
+    if plotly:
+        fig = make_subplots(rows=1, cols=2, subplot_titles=(
+            "Speedup", "Parallel efficiency"
+        ))
+    else:
+        fig, (ax_speedup, ax_efficiency) = plt.subplots(
+            1, 2, figsize=(10, 4)
+        )
+
+    for i, solver_name in enumerate(solver_names.unique()):
+        df_ = df[solver_names == solver_name]
+        n_threads, times = _get_scaling_times(df_, obj_col)
+        speedup = times[0] / times
+        efficiency = speedup * n_threads[0] / n_threads
+        if plotly:
+            color = f'rgb{tuple(255 * c for c in colors[i])}'
+            for col, y in enumerate([speedup, efficiency]):
+                fig.add_trace(go.Scatter(
+                    x=n_threads, y=y, mode='lines+markers',
+                    line_color=color, name=solver_name,
+                    legendgroup=solver_name, showlegend=col == 0,
+                    text=[solver_name for _ in n_threads],
+                    hovertemplate=(
+                        '%{text} <br> (%{x},%{y:.2f}) <extra></extra>'
+                    ),
+                ), row=1, col=col + 1)
+        else:
+            ax_speedup.plot(n_threads, speedup, color=colors[i], marker='o',
+                            label=solver_name)
+            ax_efficiency.plot(n_threads, efficiency, color=colors[i],
+                               marker='o')
+
+    # Perfect scaling, relative to the smallest number of threads.
+    ideal = n_threads_all / n_threads_all[0]
+    if plotly:
+        for col, y in enumerate([ideal, np.ones_like(ideal)]):
+            fig.add_trace(go.Scatter(
+                x=n_threads_all, y=y, mode='lines', name='ideal',
+                line=dict(color='black', dash='dot'), legendgroup='ideal',
+                showlegend=col == 0,
+            ), row=1, col=col + 1)
+        fig.update_xaxes(title_text="Number of threads", type='log')
+        fig.update_yaxes(title_text="Speedup", type='log', row=1, col=1)
+        fig.update_yaxes(title_text="Efficiency", row=1, col=2)
+        fig.update_layout(title=title)
+    else:
+        ax_speedup.plot(n_threads_all, ideal, 'k--', label='ideal')
+        ax_efficiency.axhline(1, color='k', linestyle='--')
+        for ax in (ax_speedup, ax_efficiency):
+            ax.set_xscale('log', base=2)
+            ax.set_xticks(n_threads_all)
+            ax.set_xticklabels([f"{n:g}" for n in n_threads_all])
+            ax.set_xlabel("Number of threads")
+        ax_speedup.set_yscale('log', base=2)
+        ax_speedup.set_ylabel("Speedup")
+        ax_efficiency.set_ylabel("Parallel efficiency")
+        ax_speedup.legend(fontsize=8)
+        fig.suptitle(title, fontsize=12)
+        fig.tight_layout()
+    return fig
@@ -1,11 +1,42 @@
+import io
+import copy
 import time
-
+import queue
+import shutil
+import hashlib
+import tempfile
+import threading
+import statistics
+
+from pathlib import Path
+from collections import deque
+from concurrent.futures import wait, FIRST_COMPLETED
 from datetime import datetime
+from contextlib import ExitStack
+from contextlib import contextmanager
+from contextlib import redirect_stdout, redirect_stderr
 
 from .utils import product_param
+from .constants import BACKENDS
+from .constants import SAMPLINGS
+from .constants import EVAL_MODES
+from .constants import ISOLATIONS
 from .benchmark import is_matched
 from .benchmark import _check_name_lists
-from .utils.sys_info import get_sys_info
+from .utils.results import ResultWriter
+from .utils.results import get_output_format
+from .utils.results import get_completed_runs
+from .utils.results import check_output_format
+from .utils.sys_info import get_sys_info, get_hardware_key
+from .utils.dynamic_modules import get_file_hash
+from .utils.cache_manager import prune_cache
+from .utils.isolation import report
+from .utils.isolation import get_worker
+from .utils.isolation import close_workers
+from .utils.isolation import WorkerProcess
+from .utils.threads import limit_threads
+from .utils.threads import get_cpu_blocks
+from .utils.threads import set_worker_thread_limits
 from .utils.pdb_helpers import exception_handler
 
 from .utils.colorify import colorify
@@ -19,6 +50,12 @@ from .config import RAISE_INSTALL_ERROR
 
 INFINITY = 3e38  # see: np.finfo('float32').max
 
+# A timed trial is flagged as an outlier when its distance to the median is
+# larger than OUTLIER_THRESHOLD times the MAD, scaled to match the standard
+# deviation for normally distributed times.
+OUTLIER_THRESHOLD = 3
+MAD_TO_STD = 1.4826
+
 
 def cache(func, benchmark, force=False, ignore=None):
 
@@ -33,10 +70,38 @@ def cache(func, benchmark, force=False, ignore=None):
     return func_cached
 
 
+def get_unit_key(objective, solver, stopping_criterion=None):
+    """Return a key identifying the (dataset, objective, solver) unit.
+
+    It depends on the modules and the parameters of the three objects, and on
+    the parameters of the stopping criterion if it is given. It is passed to
+    the cached functions as ``cache_key`` in place of the objective, the
+    solver and the stopping criterion, which are then not pickled to hash
+    each call. The key of the resolutions does not depend on the stopping
+    criterion, so they are reused when only ``max_runs`` or the timeout
+    change. As the cached calls record timings, the key also depends on the
+    hardware, so a cache shared between machines only reuses runs from the
+    same hardware.
+    """
+    hasher = hashlib.md5(get_hardware_key().encode())
+    for obj in [objective._dataset, objective, solver]:
+        hasher.update(get_file_hash(obj._module_filename).encode())
+        hasher.update(repr(sorted(obj._parameters.items())).encode())
+    if stopping_criterion is not None:
+        criterion = stopping_criterion
+        hasher.update(repr((
+            type(criterion).__qualname__, criterion.strategy,
+            sorted(criterion.kwargs.items()), criterion.max_runs,
+            criterion.timeout, criterion.sampling
+        )).encode())
+    return hasher.hexdigest()
+
+
 ##################################
 # Time one run of a solver
 ##################################
-def run_one_resolution(objective, solver, meta, stop_val):
+def run_one_resolution(objective, solver, meta, stop_val, start_val=None,
+                       n_warmup=0, n_trials=1, cache_key=None):
     """Run one resolution of the solver.
 
     Parameters
@@ -52,11 +117,30 @@ def run_one_resolution(objective, solver, meta, stop_val):
         Corresponds to stopping criterion, such as
         tol or max_iter for the solver. It depends
         on the stopping_strategy for the solver.
+    start_val : int | None
+        If not None, the solver is warm started from the state reached with
+        ``start_val`` iterations and only runs ``stop_val - start_val`` more
+        iterations. The time of this call only is reported.
+    n_warmup : int
+        Number of untimed calls to ``solver.run`` before the timed ones, to
+        exclude the JIT compilation, the page faults and the cache misses of
+        the first calls from the timings.
+    n_trials : int
+        Number of timed calls to ``solver.run``. The reported ``time`` is the
+        median of the trials. If larger than 1, the cost also contains the
+        minimum ``time_min``, the median absolute deviation ``time_mad`` and
+        the number of outlier trials ``n_time_outliers``, whose distance to
+        the median is larger than ``OUTLIER_THRESHOLD`` scaled MADs.
+    cache_key : str | None
+        Key of the unit, see ``get_unit_key``. It is only used to identify
+        the call in the cache, where the objective and solver are ignored.
 
     Returns
     -------
     cost : dict
-        Details on the run and the objective value obtained.
+        Details on the run and the objective value obtained. The durations
+        of the calls to ``solver.get_result`` and to the objective are stored
+        in ``time_get_result`` and ``time_objective_eval``.
     """
     # check if the module caught a failed import
     if not solver.is_installed():
@@ -67,21 +151,51 @@ def run_one_resolution(objective, solver, meta, stop_val):
     if DEBUG:
         print(f"DEBUG - Calling solver {solver} with stop val: {stop_val}")
 
+    n_iter = stop_val if start_val is None else stop_val - start_val
+    for _ in range(n_warmup):
+        solver.run(n_iter)
+
+    times = []
+    for _ in range(n_trials):
+        t_start = time.perf_counter()
+        solver.run(n_iter)
+        times.append(time.perf_counter() - t_start)
     t_start = time.perf_counter()
-    solver.run(stop_val)
-    delta_t = time.perf_counter() - t_start
     beta_hat_i = solver.get_result()
+    time_get_result = time.perf_counter() - t_start
+    t_start = time.perf_counter()
     objective_dict = objective(beta_hat_i)
+    time_objective_eval = time.perf_counter() - t_start
+
+    delta_t = statistics.median(times)
+    time_stats = {}
+    if n_trials > 1:
+        mad = statistics.median([abs(t - delta_t) for t in times])
+        time_stats = dict(
+            time_min=min(times), time_mad=mad,
+            n_time_outliers=sum(
+                abs(t - delta_t) > OUTLIER_THRESHOLD * MAD_TO_STD * mad
+                for t in times
+            )
+        )
 
-    # Add system info in results
-    info = get_sys_info()
+    return dict(
+        **meta, stop_val=stop_val, time=delta_t, **time_stats,
+        time_get_result=time_get_result,
+        time_objective_eval=time_objective_eval, **objective_dict
+    )
 
-    return dict(**meta, stop_val=stop_val, time=delta_t,
-                **objective_dict, **info)
+
+def _run_warmup(objective, solver):
+    "Call the warmup of the solver and return its duration in seconds."
+    t_start = time.perf_counter()
+    solver.warmup()
+    return time.perf_counter() - t_start
 
 
 def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
-                   force=False):
+                   force=False, process=None, n_warmup=0, n_trials=1,
+                   cache_key=None):
     """Run all repetitions of the solver for a value of stopping criterion.
 
     Parameters
@@ -100,6 +214,20 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
     force : bool
         If force is set to True, ignore the cache and run the computations
         for the solver anyway. Else, use the cache if available.
+    process : WorkerProcess | None
+        If not None, the resolutions are run in this worker process, which
+        holds the objective and the solver. It is killed if a resolution does
+        not end before the timeout and the curve computed before is kept, with
+        the status 'timeout'. The resolutions are then not cached one by one.
+    n_warmup : int
+        Number of untimed runs of the solver before timing each resolution.
+    n_trials : int
+        Number of timed runs of the solver for each resolution. See
+        ``run_one_resolution``.
+    cache_key : str | None
+        Key of the unit and the stopping criterion, see ``get_unit_key``. It
+        is only used to identify the call in the cache, where the objective,
+        the solver and the stopping criterion are ignored.
 
     Returns
     -------
@@ -111,7 +239,47 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
 
     # Create a Memory object to cache the computations in the benchmark folder
     # and handle cases where we force the run.
-    run_one_resolution_cached = cache(run_one_resolution, benchmark, force)
+    # The resolutions are identified by the key of the unit without the
+    # stopping criterion, to be reused whatever the max_runs and timeout.
+    run_one_resolution_cached = cache(
+        run_one_resolution, benchmark, force, ignore=['objective', 'solver']
+    )
+    resolution_key = get_unit_key(objective, solver)
+
+    # Warm started solvers resume from their previous state, so the
+    # resolutions depend on each other and cannot be cached. Their state is
+    # reset by set_objective before computing the curve.
+    warm_start = solver.warm_start
+
+    # Warm up the solver, e.g. for JIT compilation, before the timed runs.
+    # This is done before resetting warm started solvers, so their state is
+    # not changed by the warmup.
+    if process is not None:
+        try:
+            compile_time = process.call(
+                _run_warmup, deadline=stopping_criterion._deadline
+            )
+        except TimeoutError:
+            return [], 'timeout'
+    else:
+        compile_time = _run_warmup(objective, solver)
+
+    if warm_start:
+        if stopping_criterion.strategy != 'iteration':
+            raise ValueError(
+                f"{solver} sets warm_start=True, which is only supported "
+                "with stopping_strategy='iteration'."
+            )
+        if n_warmup > 0 or n_trials > 1:
+            raise ValueError(
+                f"{solver} sets warm_start=True, which cannot be used with "
+                "warmup runs or several trials as each run continues from "
+                "the previous one."
+            )
+        if process is not None:
+            process.call(_reset_solver)
+        else:
+            solver._set_objective(objective)
 
     # compute initial value
     stopping_criterion.show_progress('initialization')
@@ -122,7 +290,39 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
     curve = []
     while not stop:
 
-        cost = run_one_resolution_cached(stop_val=stop_val, **call_args)
+        resolution_args = dict(stop_val=stop_val)
+        if not warm_start:
+            resolution_args.update(n_warmup=n_warmup, n_trials=n_trials)
+        else:
+            prev_stop_val, prev_time = (
+                (curve[-1]['stop_val'], curve[-1]['time']) if curve
+                else (0, 0.)
+            )
+            if stop_val < prev_stop_val:
+                raise ValueError(
+                    f"{solver} sets warm_start=True but the number of "
+                    f"iterations decreased from {prev_stop_val} to {stop_val}."
+                )
+            resolution_args['start_val'] = prev_stop_val
+
+        if process is not None:
+            try:
+                cost = process.call(
+                    run_one_resolution, meta=meta,
+                    deadline=stopping_criterion._deadline, **resolution_args
+                )
+            except TimeoutError:
+                status = 'timeout'
+                break
+        elif warm_start:
+            cost = run_one_resolution(**call_args, **resolution_args)
+        else:
+            cost = run_one_resolution_cached(
+                **call_args, **resolution_args, cache_key=resolution_key
+            )
+        if warm_start:
+            cost['time'] += prev_time
+        cost['compile_time'] = compile_time
         curve.append(cost)
 
         # Check the stopping criterion and update rho if necessary.
@@ -133,6 +333,11 @@ def run_one_to_cvg(benchmark, objective, solver, meta, stopping_criterion,
     return curve, status
 
 
+def _reset_solver(objective, solver):
+    "Reset the state of a solver run in a worker process."
+    solver._set_objective(objective)
+
+
 class _Callback:
     """Callback class to monitor convergence.
 
@@ -145,6 +350,19 @@ class _Callback:
         Contains objective and data names, problem dimension, etc.
     stopping_criterion : StoppingCriterion
         Object to check if we need to stop a solver.
+    eval_mode : 'sync' | 'deferred' | 'thread'
+        If 'sync', the objective is evaluated in the callback call. If
+        'deferred', the callback only copies the iterate in a buffer. The
+        buffered iterates are evaluated at once with the objective's
+        ``compute_batch`` when the buffer is full or when the solver stops,
+        and the stopping criterion is then checked on them. If
+        'thread', the copies of the iterates are put in a queue and evaluated
+        in order by a worker thread, which checks the stopping criterion. The
+        callback blocks when the queue is full.
+    buffer_size : int
+        Number of iterates stored before their evaluation with
+        ``eval_mode='deferred'``, or size of the queue with
+        ``eval_mode='thread'``.
 
     Attributes
     ----------
@@ -155,8 +373,6 @@ class _Callback:
     meta : dict
         Metadata passed to store in Cost results.
         Contains objective and data names, problem dimension, etc.
-    info : dict
-        A dictionary with info from the current system.
     curve : list
         The convergence curve stored as a list of dict.
     status : 'running' | 'done' | 'diverged' | 'timeout' | 'max_runs'
@@ -174,13 +390,15 @@ class _Callback:
         The time when exiting the callback call.
     """
 
-    def __init__(self, objective, meta, stopping_criterion):
+    def __init__(self, objective, meta, stopping_criterion, eval_mode='sync',
+                 buffer_size=32):
         self.objective = objective
         self.meta = meta
         self.stopping_criterion = stopping_criterion
+        self.eval_mode = eval_mode
+        self.buffer_size = buffer_size
 
         # Initialize local variables
-        self.info = get_sys_info()
         self.curve = []
         self.status = 'running'
         self.it = 0
@@ -188,27 +406,39 @@ class _Callback:
         self.next_stopval = 0
         self.time_callback = time.perf_counter()
 
+        # Copies of the iterates waiting for their evaluation. The buffer is
+        # allocated with the first iterate. In 'deferred' mode, the snapshots
+        # store the iteration number, the time and the wall clock time at
+        # which the buffered iterates were reached. In 'thread' mode, they are
+        # sent to the worker through the queue. The timeout is checked against
+        # the wall clock time of each iterate, not of its evaluation.
+        self._buffer = None
+        self._snapshots = []
+        self._n_submitted = 0
+        self._worker = None
+        self._error = None
+
     def __call__(self, x):
         # Stop time and update computation time since the begining
         t0 = time.perf_counter()
         self.time_iter += t0 - self.time_callback
 
+        # Stop if the worker thread evaluated an iterate that stops the solver
+        if self._worker is not None and self._stop_event.is_set():
+            self._join_worker()
+            return False
+
         # Evaluate the iteration if necessary.
         if self.it == self.next_stopval:
-            objective_dict = self.objective(x)
-            self.curve.append(dict(
-                **self.meta, stop_val=self.it,
-                time=self.time_iter,
-                **objective_dict, **self.info
-            ))
-
-            # Check the stopping criterion
-            should_stop_res = self.stopping_criterion.should_stop_solver(
-                self.next_stopval, self.curve
-            )
-            stop, status, self.next_stopval = should_stop_res
+            if self.eval_mode == 'deferred':
+                stop = self._snapshot(x)
+            elif self.eval_mode == 'thread':
+                stop = self._submit(x)
+            else:
+                stop, self.next_stopval = self._evaluate(
+                    self.it, self.time_iter, x
+                )
             if stop:
-                self.status = status
                 return False
 
         # Update iteration number and restart time measurment.
@@ -216,6 +446,155 @@ class _Callback:
         self.time_callback = time.perf_counter()
         return True
 
+    def _evaluate(self, stop_val, time_iter, x, timestamp=None):
+        """Store the objective value of x and check the stopping criterion.
+
+        Returns whether the solver should stop and the next stop_val.
+        """
+        t_start = time.perf_counter()
+        objective_dict = self.objective(x)
+        time_eval = time.perf_counter() - t_start
+        return self._add_point(
+            stop_val, time_iter, objective_dict, time_eval, timestamp
+        )
+
+    def _add_point(self, stop_val, time_iter, objective_dict, time_eval,
+                   timestamp=None):
+        """Add a point to the curve and check the stopping criterion.
+
+        ``time_eval`` is the time taken to compute ``objective_dict`` and
+        ``timestamp`` the wall clock time at which the iterate was reached,
+        see ``StoppingCriterion.should_stop_solver``.
+        """
+        self.curve.append(dict(
+            **self.meta, stop_val=stop_val, time=time_iter,
+            time_objective_eval=time_eval, **objective_dict
+        ))
+        # Keep the point if the solver is killed in a worker process.
+        report(self.curve[-1])
+
+        stop, status, next_stopval = (
+            self.stopping_criterion.should_stop_solver(
+                stop_val, self.curve, timestamp=timestamp
+            )
+        )
+        if stop:
+            self.status = status
+        return stop, next_stopval
+
+    def _copy_to_buffer(self, x, n_slots):
+        """Copy x in the next slot of the buffer and return the slot index.
+
+        The buffer is used as a ring buffer with ``n_slots`` slots. The copy
+        is needed as solvers can update the iterate inplace.
+        """
+        import numpy as np
+
+        if self._buffer is None:
+            if isinstance(x, np.ndarray):
+                self._buffer = np.empty((n_slots, *x.shape), x.dtype)
+            else:
+                self._buffer = [None] * n_slots
+
+        i = self._n_submitted % n_slots
+        if isinstance(self._buffer, np.ndarray):
+            self._buffer[i] = x
+        else:
+            self._buffer[i] = copy.deepcopy(x)
+        self._n_submitted += 1
+        return i
+
+    def _snapshot(self, x):
+        "Copy x in the buffer and evaluate the buffer if it is full."
+        self._copy_to_buffer(x, self.buffer_size)
+        self._snapshots.append((self.it, self.time_iter, time.time()))
+
+        # Without the objective values, only the default next stop_val can be
+        # computed. It is updated when the buffer is evaluated, which happens
+        # as soon as the solver would be stopped by the timeout or max_runs.
+        self.next_stopval = self.stopping_criterion.get_next_stop_val(self.it)
+        n_eval = len(self.curve) + len(self._snapshots) - 1
+        if (len(self._snapshots) == self.buffer_size
+                or self.stopping_criterion.is_budget_reached(n_eval)):
+            return self._flush()
+        return False
+
+    def _flush(self):
+        "Evaluate the buffered iterates, in order, until the solver stops."
+        snapshots, self._snapshots = self._snapshots, []
+        self._n_submitted = 0
+
+        # Evaluate all the iterates at once, which is faster for objectives
+        # implementing compute_batch. The time of the batch is shared equally
+        # between the iterates.
+        t_start = time.perf_counter()
+        objective_dicts = self.objective._call_batch(
+            self._buffer[:len(snapshots)]
+        )
+        time_eval = (time.perf_counter() - t_start) / len(snapshots)
+        for (stop_val, time_iter, timestamp), objective_dict in zip(
+                snapshots, objective_dicts):
+            stop, self.next_stopval = self._add_point(
+                stop_val, time_iter, objective_dict, time_eval, timestamp
+            )
+            if stop:
+                return True
+        return False
+
+    def _submit(self, x):
+        "Send a copy of x to the worker thread evaluating the objective."
+        if self._worker is None:
+            self._queue = queue.Queue(maxsize=self.buffer_size)
+            self._stop_event = threading.Event()
+            self._worker = threading.Thread(
+                target=self._evaluate_queue, daemon=True
+            )
+            self._worker.start()
+
+        # The iterates in the queue and the one being evaluated by the worker
+        # are never overwritten with buffer_size + 2 slots. Putting in a full
+        # queue blocks, so the solver waits for the worker to catch up.
+        i = self._copy_to_buffer(x, self.buffer_size + 2)
+        self._queue.put((self.it, self.time_iter, time.time(), i))
+
+        # The stopping criterion is checked by the worker. Only the default
+        # next stop_val can be computed here. Wait for the evaluations when
+        # the solver would be stopped by the timeout or max_runs.
+        self.next_stopval = self.stopping_criterion.get_next_stop_val(self.it)
+        if self.stopping_criterion.is_budget_reached(self._n_submitted - 1):
+            self._join_worker()
+            return True
+        return False
+
+    def _evaluate_queue(self):
+        "Evaluate the iterates from the queue in order, in the worker thread."
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            # Once stopped, only empty the queue so the solver never blocks.
+            if self._stop_event.is_set():
+                continue
+            try:
+                stop_val, time_iter, timestamp, i = item
+                stop, _ = self._evaluate(
+                    stop_val, time_iter, self._buffer[i], timestamp
+                )
+            except BaseException as e:
+                self._error, stop = e, True
+            if stop:
+                self._stop_event.set()
+
+    def _join_worker(self):
+        "Wait for the evaluation of all the submitted iterates."
+        if self._worker is None:
+            return
+        self._queue.put(None)
+        self._worker.join()
+        self._worker = None
+        if self._error is not None:
+            raise self._error
+
     def get_results(self):
         """Get the results stored by the callback
 
@@ -226,12 +605,71 @@ class _Callback:
         status : 'done' | 'diverged' | 'timeout' | 'max_runs'
             The status on which the solver was stopped.
         """
+        if len(self._snapshots) > 0:
+            self._flush()
+        self._join_worker()
         return self.curve, self.status
 
 
+def run_with_callback(objective, solver, meta, stopping_criterion,
+                      eval_mode='sync'):
+    """Run a solver with the callback strategy and return its curve.
+
+    Parameters
+    ----------
+    objective : instance of BaseObjective
+        The objective to minimize.
+    solver : instance of BaseSolver
+        The solver to use.
+    meta : dict
+        Metadata passed to store in Cost results.
+        Contains objective and data names, problem dimension, etc.
+    stopping_criterion : StoppingCriterion
+        Object to check if we need to stop a solver.
+    eval_mode : 'sync' | 'deferred' | 'thread'
+        How the objective is evaluated. See ``_Callback``.
+
+    Returns
+    -------
+    curve : list
+        Details on the run and the objective value obtained.
+    status : 'done' | 'diverged' | 'timeout' | 'max_runs'
+        The status on which the solver was stopped.
+    """
+    # Warm up the solver before creating the callback, which starts the timer.
+    compile_time = _run_warmup(objective, solver)
+    callback = _Callback(
+        objective, dict(**meta, compile_time=compile_time),
+        stopping_criterion, eval_mode=eval_mode
+    )
+    solver.run(callback)
+    return callback.get_results()
+
+
+def _run_with_callback_in_worker(objective, solver, criterion_kwargs,
+                                 criterion_deadline, **kwargs):
+    """Call ``run_with_callback`` in a worker holding the objective and solver.
+
+    The stopping criterion is rebuilt in the worker with ``criterion_kwargs``,
+    from the solver of the worker, as pickling it would send the solver, the
+    objective and the dataset again. Its deadline is the one set in the main
+    process.
+    """
+    stopping_criterion = solver.stopping_criterion.get_runner_instance(
+        solver=solver, **criterion_kwargs
+    )
+    stopping_criterion._deadline = criterion_deadline
+    return run_with_callback(
+        objective, solver, stopping_criterion=stopping_criterion, **kwargs
+    )
+
+
 def run_one_solver(benchmark, objective, solver, meta, max_runs, n_repetitions,
                    timeout=None, tag=None, show_progress=True, force=False,
-                   pdb=False):
+                   skip_reps=(), eval_mode='sync', sampling='geometric',
+                   budget=None, isolation='none', n_threads=None, cpus=None,
+                   solver_name=None, n_warmup=0, n_trials=1,
+                   time_set_objective=None, pdb=False):
     """Run all repetitions of the solver for a value of stopping criterion.
 
     Parameters
@@ -259,24 +697,77 @@ def run_one_solver(benchmark, objective, solver, meta, max_runs, n_repetitions,
     force : bool
         If force is set to True, ignore the cache and run the computations
         for the solver anyway. Else, use the cache if available.
+    skip_reps : set of int
+        Indices of the repetitions that are not run, as their results are
+        already available.
+    eval_mode : 'sync' | 'deferred' | 'thread'
+        How the objective is evaluated for solvers with the callback
+        strategy. See ``_Callback``.
+    sampling : 'geometric' | 'time'
+        How the stop values are spaced. See
+        ``StoppingCriterion.get_runner_instance``.
+    budget : float | None
+        Time in seconds allocated to this solver by the global budget of the
+        benchmark, see ``BudgetScheduler``. If not None, the solver is run
+        with the smallest of ``timeout`` and ``budget`` and the cost of each
+        repetition has a ``budget_truncated`` entry, which is True if the
+        repetition was stopped because of the budget.
+    isolation : 'none' | 'repetition' | 'solver'
+        If 'repetition', each repetition is run in a new worker process. If
+        'solver', all the runs of a solver class are made in the same
+        long-lived worker process, see ``get_worker``. The objective and the
+        solver are sent once for all the repetitions. In both cases, the
+        worker is killed if the solver does not return before the timeout and
+        the curve computed before is kept, with the status 'timeout'.
+    n_threads : int | None
+        Maximal number of threads of the native thread pools, such as BLAS
+        or OpenMP, used by the solver. If None, the threads are not limited.
+    cpus : list of int | None
+        If not None, the solver only runs on these CPUs.
+    solver_name : str | None
+        Name of the solver in the results. If None, use ``str(solver)``.
+    n_warmup : int
+        Number of untimed runs of the solver before timing each stop value.
+        Only used for solvers with the iteration or tolerance strategy.
+    n_trials : int
+        Number of timed runs of the solver for each stop value, see
+        ``run_one_resolution``. Only used for solvers with the iteration or
+        tolerance strategy.
+    time_set_objective : float | None
+        Duration of the call to ``solver._set_objective``, made before
+        running the solver. If not None, it is stored in the
+        ``time_set_objective`` entry of each cost.
     pdb : bool
         If pdb is set to True, open a debugger on error.
 
     Returns
     -------
     curve : list of Cost
-        The cost obtained for all repetitions and all stop values.
+        The cost obtained for all repetitions and all stop values. Each cost
+        has a ``hardware_key`` entry identifying the machine which ran the
+        solver, see ``get_hardware_key``.
     """
+    truncated = budget is not None and budget < timeout
+    if truncated:
+        timeout = budget
 
     # Create a Memory object to cache the computations in the benchmark folder
-    run_one_to_cvg_cached = cache(run_one_to_cvg, benchmark, force,
-                                  ignore=['force'])
+    # The unit is identified in the cache by its key, computed for each
+    # repetition with its stopping criterion.
+    run_one_to_cvg_cached = cache(
+        run_one_to_cvg, benchmark, force,
+        ignore=['force', 'process', 'objective', 'solver',
+                'stopping_criterion']
+    )
 
     curve = []
     states = []
+    hardware_key = get_hardware_key()
 
     with exception_handler(tag, pdb=pdb):
         for rep in range(n_repetitions):
+            if rep in skip_reps:
+                continue
             if show_progress:
                 progress_str = (
                     f"{tag} {{progress}} ({rep + 1} / {n_repetitions} reps)"
@@ -284,33 +775,92 @@ def run_one_solver(benchmark, objective, solver, meta, max_runs, n_repetitions,
             else:
                 progress_str = None
 
-            meta_rep = dict(**meta, idx_rep=rep, solver_name=str(solver))
+            meta_rep = dict(
+                **meta, idx_rep=rep, solver_name=solver_name or str(solver)
+            )
 
-            stopping_criterion = solver.stopping_criterion.get_runner_instance(
+            criterion_kwargs = dict(
                 max_runs=max_runs, timeout=timeout / n_repetitions,
-                progress_str=progress_str, solver=solver
+                progress_str=progress_str, sampling=sampling
+            )
+            stopping_criterion = solver.stopping_criterion.get_runner_instance(
+                solver=solver, **criterion_kwargs
             )
 
             solver_strategy = solver._solver_strategy
 
-            if solver_strategy == "callback":
-                callback = _Callback(
-                    objective, meta_rep, stopping_criterion
-                )
-                solver.run(callback)
-                curve_one_rep, status = callback.get_results()
-            else:
-                curve_one_rep, status = run_one_to_cvg_cached(
-                    benchmark=benchmark, objective=objective, solver=solver,
-                    meta=meta_rep, stopping_criterion=stopping_criterion,
-                    force=force
-                )
+            with ExitStack() as stack:
+                process = None
+                if isolation == 'repetition':
+                    process = stack.enter_context(
+                        WorkerProcess(objective=objective, solver=solver)
+                    )
+                elif isolation == 'solver':
+                    process = get_worker(
+                        type(solver), objective=objective, solver=solver
+                    )
+
+                # Limit the threads in the process running the solver and
+                # record the numbers of threads actually used.
+                thread_limits = dict(n_threads=n_threads, cpus=cpus)
+                if process is None:
+                    thread_counts = stack.enter_context(
+                        limit_threads(**thread_limits)
+                    )
+                else:
+                    thread_counts = process.call(
+                        set_worker_thread_limits, **thread_limits
+                    )
+                meta_rep.update(thread_counts)
+
+                if solver_strategy == "callback":
+                    callback_args = dict(meta=meta_rep, eval_mode=eval_mode)
+                    if process is None:
+                        curve_one_rep, status = run_with_callback(
+                            objective=objective, solver=solver,
+                            stopping_criterion=stopping_criterion,
+                            **callback_args
+                        )
+                    else:
+                        deadline = stopping_criterion._deadline
+                        try:
+                            curve_one_rep, status = process.call(
+                                _run_with_callback_in_worker,
+                                deadline=deadline,
+                                criterion_kwargs=criterion_kwargs,
+                                criterion_deadline=deadline, **callback_args
+                            )
+                        except TimeoutError:
+                            curve_one_rep, status = process.reports, 'timeout'
+                else:
+                    curve_one_rep, status = run_one_to_cvg_cached(
+                        benchmark=benchmark, objective=objective,
+                        solver=solver, meta=meta_rep,
+                        stopping_criterion=stopping_criterion, force=force,
+                        process=process, n_warmup=n_warmup, n_trials=n_trials,
+                        cache_key=get_unit_key(
+                            objective, solver, stopping_criterion
+                        )
+                    )
+
+            if time_set_objective is not None:
+                for cost in curve_one_rep:
+                    cost['time_set_objective'] = time_set_objective
+            if budget is not None:
+                for cost in curve_one_rep:
+                    cost['budget_truncated'] = (
+                        truncated and status == 'timeout'
+                    )
+            for cost in curve_one_rep:
+                cost['hardware_key'] = hardware_key
 
             curve.extend(curve_one_rep)
             states.append(status)
 
         if 'diverged' in states:
             final_status = colorify('diverged', RED)
+        elif truncated and 'timeout' in states:
+            final_status = colorify('done (budget exhausted)', YELLOW)
         elif 'timeout' in states:
             final_status = colorify('done (timeout)', YELLOW)
         elif 'max_runs' in states:
@@ -322,11 +872,16 @@ def run_one_solver(benchmark, objective, solver, meta, max_runs, n_repetitions,
     return curve
 
 
-def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
-                  dataset_names=None, objective_filters=None,
-                  max_runs=10, n_repetitions=1, timeout=100,
-                  plot_result=True, html=True, show_progress=True, pdb=False):
-    """Run full benchmark.
+def _list_solver_runs(benchmark, solver_names=None, forced_solvers=None,
+                      dataset_names=None, objective_filters=None,
+                      n_repetitions=1, completed=None, n_threads=None,
+                      scaling_threads=None, data_cache_dir=None):
+    """Iterate over all the (dataset, objective, solver) units to run.
+
+    The datasets, objectives and solvers that do not match the filters, are
+    not installed or are skipped are reported on the standard output and not
+    returned. As this is a generator, these reports are interleaved with the
+    runs when the units are run sequentially.
 
     Parameters
     ----------
@@ -344,33 +899,35 @@ def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
     objective_filters : list | None
         Filters to select specific objective parameters. If None,
         all objective parameters are tested
-    max_runs : int
-        The maximum number of solver runs to perform to estimate
-        the convergence curve.
     n_repetitions : int
-        The number of repetitions to run. Defaults to 1.
-    timeout : float
-        The maximum duration in seconds of the solver run.
-    plot_result : bool
-        If set to True (default), display the result plot and save them in
-        the benchmark directory.
-    html : bool
-        If set to True (default), display the result plot in HTML, otherwise
-        in matplotlib figures, default is True.
-    show_progress : bool
-        If show_progress is set to True, display the progress of the benchmark.
-    pdb : bool
-        It pdb is set to True, open a debugger on error.
-
-    Returns
-    -------
-    df : instance of pandas.DataFrame
-        The benchmark results. If multiple metrics were computed, each
-        one is stored in a separate column. If the number of metrics computed
-        by the objective is not the same for all parameters, the missing data
-        is set to `NaN`.
+        The number of repetitions to run.
+    completed : dict | None
+        Repetitions already run for each (data_name, objective_name,
+        solver_name), as returned by ``get_completed_runs``. The units with
+        all their repetitions completed are skipped. If None, all the units
+        are run.
+    n_threads : int | None
+        Maximal number of threads used by the solvers, unless they set their
+        ``threads`` attribute.
+    scaling_threads : list of int | None
+        If not None, each solver gives one unit per number of threads in the
+        list. The number of threads is added to the solver name and stored in
+        the ``n_threads`` column of the results. It overrides ``n_threads``
+        and the ``threads`` attribute of the solvers.
+    data_cache_dir : Path | None
+        If not None, the data of the datasets are stored in this folder and
+        loaded memory-mapped, also in the worker processes, see
+        ``benchopt.utils.data_cache``.
+
+    Yields
+    ------
+    run_kwargs : dict
+        Arguments for ``run_one_solver`` specific to this unit, i.e.
+        ``objective``, ``solver``, ``meta``, ``tag``, ``solver_name``,
+        ``force``, ``skip_reps``, ``n_threads`` and ``time_set_objective``.
     """
-    print("Benchopt is running")
+    if completed is None:
+        completed = {}
 
     # Load the objective class for this benchmark and the datasets
     objective_class = benchmark.get_benchmark_objective()
@@ -380,12 +937,12 @@ def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
     solver_classes = benchmark.get_solvers()
     included_solvers = _check_name_lists(solver_names, forced_solvers)
 
-    run_statistics = []
     for dataset_class in datasets:
         for dataset_parameters in product_param(dataset_class.parameters):
             dataset = dataset_class.get_instance(**dataset_parameters)
             if not is_matched(str(dataset), dataset_names):
                 continue
+            dataset._cache_dir = data_cache_dir
             print_normalize(f"{dataset}")
             if not dataset.is_installed(
                     raise_on_not_installed=RAISE_INSTALL_ERROR):
@@ -424,8 +981,38 @@ def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
                             print_normalize(f"{tag} {status}")
                             continue
 
-                        # Set objective an skip if necessary.
+                        # With scaling_threads, the solver is run once for
+                        # each number of threads, with a distinct name.
+                        units = []
+                        for n_threads_unit in scaling_threads or [None]:
+                            solver_name = str(solver)
+                            if n_threads_unit is not None:
+                                solver_name += f" (threads={n_threads_unit})"
+
+                            # Skip the repetitions already in the resumed
+                            # results.
+                            skip_reps = completed.get(
+                                (str(dataset), str(objective), solver_name),
+                                set()
+                            )
+                            if set(range(n_repetitions)) <= skip_reps:
+                                status = colorify("done (resumed)", GREEN)
+                                print_normalize(
+                                    f"{colorify(f'|----{solver_name}:')} "
+                                    f"{status}"
+                                )
+                                continue
+                            units.append(
+                                (n_threads_unit, solver_name, skip_reps)
+                            )
+                        if len(units) == 0:
+                            continue
+
+                        # Set objective an skip if necessary. It is timed as
+                        # it may convert the data for the solver.
+                        t_start = time.perf_counter()
                         skip, reason = solver._set_objective(objective)
+                        time_set_objective = time.perf_counter() - t_start
                         if skip:
                             print_normalize(
                                 f"{tag} {colorify('skip', YELLOW)}"
@@ -445,28 +1032,512 @@ def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
                                  and len(forced_solvers) > 0
                                  and is_matched(str(solver), forced_solvers))
 
-                        run_statistics.extend(run_one_solver(
-                            benchmark=benchmark, objective=objective,
-                            solver=solver, meta=meta, tag=tag,
-                            max_runs=max_runs, n_repetitions=n_repetitions,
-                            timeout=timeout, show_progress=show_progress,
-                            force=force, pdb=pdb
-                        ))
-
-    import pandas as pd
-    df = pd.DataFrame(run_statistics)
-    if df.empty:
+                        for n_threads_unit, solver_name, skip_reps in units:
+                            meta_unit = meta
+                            if n_threads_unit is None:
+                                n_threads_unit = (
+                                    n_threads if solver.threads is None
+                                    else solver.threads
+                                )
+                            else:
+                                meta_unit = dict(
+                                    meta, n_threads=n_threads_unit
+                                )
+                            yield dict(
+                                objective=objective, solver=solver,
+                                meta=meta_unit,
+                                tag=colorify(f"|----{solver_name}:"),
+                                solver_name=solver_name, force=force,
+                                skip_reps=skip_reps, n_threads=n_threads_unit,
+                                time_set_objective=time_set_objective
+                            )
+
+
+def _run_one_solver_captured(**kwargs):
+    """Run one solver and return its curve with the output it produced.
+
+    This is used to run solvers in worker processes. The output is captured to
+    be displayed by the main process, so the lines of concurrent runs are not
+    interleaved. The system info of the worker are also returned, as it may
+    run on another machine than the main process.
+    """
+    with io.StringIO() as output:
+        with redirect_stdout(output), redirect_stderr(output):
+            curve = run_one_solver(**kwargs)
+        return curve, output.getvalue(), get_sys_info()
+
+
+@contextmanager
+def get_executor(n_jobs, backend='loky'):
+    """Context manager providing an executor to run the benchmark in parallel.
+
+    All executors follow the ``concurrent.futures.Executor`` interface, so
+    any such executor can also be passed directly to ``run_benchmark``.
+
+    Parameters
+    ----------
+    n_jobs : int
+        Number of worker processes.
+    backend : str in {'loky', 'multiprocessing', 'dask'}
+        Type of executor. ``'loky'`` and ``'multiprocessing'`` use a local
+        process pool while ``'dask'`` starts a ``distributed.LocalCluster``.
+
+    Yields
+    ------
+    executor : concurrent.futures.Executor
+        Executor used to submit the solver runs.
+    """
+    if backend == 'loky':
+        # The loky executor is reused between calls, do not shut it down.
+        from joblib.externals.loky import get_reusable_executor
+        yield get_reusable_executor(max_workers=n_jobs)
+    elif backend == 'multiprocessing':
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            yield executor
+    elif backend == 'dask':
+        try:
+            from distributed import Client, LocalCluster
+        except ImportError:
+            raise ImportError(
+                "Need to install dask.distributed to use backend 'dask'.\n"
+                "Please run `pip install distributed`."
+            )
+        with LocalCluster(n_workers=n_jobs, threads_per_worker=1) as cluster:
+            with Client(cluster) as client:
+                yield _as_executor(client)
+    else:
+        raise ValueError(
+            f"Unknown parallel backend '{backend}'. Should be in {BACKENDS}."
+        )
+
+
+def _as_executor(executor):
+    """Make sure the executor follows the concurrent.futures API.
+
+    A ``distributed.Client`` is wrapped in its ``concurrent.futures``
+    interface. The tasks are not pure as they are timed, so dask should not
+    deduplicate them.
+    """
+    if hasattr(executor, 'get_executor'):
+        return executor.get_executor(pure=False)
+    return executor
+
+
+class BudgetScheduler:
+    """Share a global time budget between the units of a benchmark.
+
+    Each unit gets an equal share of the worker time left before the
+    deadline, computed when the unit is started. The worker time is the time
+    left times the number of workers, minus the time still allocated to the
+    units running on the other workers. As the share is computed with the time
+    actually left, the time not used by the units that converged early is
+    reallocated to the next ones.
+
+    Parameters
+    ----------
+    total_timeout : float
+        Time in seconds allowed to run all the units.
+    n_units : int
+        Number of units to run.
+    n_workers : int
+        Number of units run concurrently. A unit never gets more than the time
+        left before the deadline.
+    """
+
+    def __init__(self, total_timeout, n_units, n_workers=1):
+        self.deadline = time.time() + total_timeout
+        self.n_units_left = n_units
+        self.n_workers = n_workers
+        # End of the time allocated to the unit running on each worker.
+        self._allocated = {}
+
+    def allocate(self, slot=0):
+        """Return the time in seconds allocated to the next unit.
+
+        The unit runs on the worker ``slot``, whose previous unit is done.
+        """
+        now = time.time()
+        self._allocated.pop(slot, None)
+        time_left = max(self.deadline - now, 0)
+        outstanding = sum(
+            max(end - now, 0) for end in self._allocated.values()
+        )
+        budget = max(time_left * self.n_workers - outstanding, 0)
+        budget = min(budget / max(self.n_units_left, 1), time_left)
+        self.n_units_left -= 1
+        self._allocated[slot] = now + budget
+        return budget
+
+
+def _run_solvers_in_parallel(all_runs, executor, n_workers=None,
+                             scheduler=None, cpu_blocks=None, **run_kwargs):
+    """Run all the solver units with the given executor.
+
+    The curves are yielded in the order of ``all_runs``, so the result file
+    is the same as with a sequential run, with the system info of the worker
+    which computed them. The output of each unit is displayed once it is
+    done, prefixed with the dataset and objective names.
+
+    Note that the objective and the solver are only pickled with their
+    parameters, so each worker loads the data on its own. It keeps the last
+    dataset it loaded, so as the units are submitted ordered by dataset, each
+    dataset is loaded about once per worker.
+
+    If ``n_workers`` is not None, only ``n_workers`` units are submitted at
+    once. Each submitted unit holds one of ``n_workers`` slots until it is
+    done, even if the curves of the units submitted before are not yielded
+    yet. With a ``scheduler``, the budget of each unit is allocated when it
+    can start. With ``cpu_blocks``, the unit is pinned to the block of
+    CPUs of its slot, so the units running at the same time use different
+    CPUs.
+    """
+    run_kwargs.update(show_progress=False)
+
+    def get_next_curve():
+        curve, output, sys_info = futures.popleft().result()
+        print(output, end='', flush=True)
+        return curve, sys_info
+
+    def free_slots_of_done_units():
+        # Wait for at least one of the running units to be done.
+        wait(running, return_when=FIRST_COMPLETED)
+        for future in [f for f in running if f.done()]:
+            free_slots.append(running.pop(future))
+
+    futures = deque()
+    running = {}
+    free_slots = deque(range(n_workers)) if n_workers is not None else None
+    for unit_kwargs in all_runs:
+        meta = unit_kwargs['meta']
+        unit_kwargs['tag'] = colorify(
+            f"{meta['data_name']} | {meta['objective_name']} | "
+            f"{unit_kwargs['solver_name']}:"
+        )
+        slot = None
+        if n_workers is not None:
+            if len(free_slots) == 0:
+                free_slots_of_done_units()
+            slot = free_slots.popleft()
+        if scheduler is not None:
+            unit_kwargs['budget'] = scheduler.allocate(slot)
+        if cpu_blocks is not None:
+            unit_kwargs['cpus'] = cpu_blocks[slot]
+        future = executor.submit(
+            _run_one_solver_captured, **unit_kwargs, **run_kwargs
+        )
+        futures.append(future)
+        if slot is not None:
+            running[future] = slot
+
+        # Yield the curves that are ready, in the order of all_runs.
+        while futures and futures[0].done():
+            yield get_next_curve()
+
+    while futures:
+        yield get_next_curve()
+
+
+def _run_all_solvers(all_runs, n_jobs=1, backend='loky', executor=None,
+                     total_timeout=None, pin_cpus=False, show_progress=True,
+                     **run_kwargs):
+    """Run all the solver units and yield their curves once computed.
+
+    Each curve is yielded with the system info of the process which computed
+    it, as the units may run on other machines with an ``executor``.
+
+    The units are run with ``executor`` if it is given, with a pool of
+    ``n_jobs`` workers if ``n_jobs > 1`` and sequentially otherwise. If
+    ``total_timeout`` is not None, the units are listed first to share this
+    time between them with a ``BudgetScheduler``. If ``pin_cpus`` is True,
+    the CPUs are split in ``n_jobs`` blocks and each unit is pinned to a
+    block not used by the other units running at the same time.
+    """
+    scheduler = None
+    if total_timeout is not None:
+        all_runs = list(all_runs)
+        scheduler = BudgetScheduler(
+            total_timeout, n_units=len(all_runs), n_workers=n_jobs
+        )
+    cpu_blocks = get_cpu_blocks(n_jobs) if pin_cpus else None
+    n_workers = None
+    if scheduler is not None or cpu_blocks is not None:
+        n_workers = n_jobs
+    parallel_kwargs = dict(
+        n_workers=n_workers, scheduler=scheduler, cpu_blocks=cpu_blocks
+    )
+
+    if executor is not None:
+        yield from _run_solvers_in_parallel(
+            all_runs, _as_executor(executor), **parallel_kwargs, **run_kwargs
+        )
+    elif n_jobs != 1:
+        with get_executor(n_jobs, backend) as executor:
+            yield from _run_solvers_in_parallel(
+                all_runs, executor, **parallel_kwargs, **run_kwargs
+            )
+    else:
+        for unit_kwargs in all_runs:
+            if scheduler is not None:
+                unit_kwargs['budget'] = scheduler.allocate()
+            if cpu_blocks is not None:
+                unit_kwargs['cpus'] = cpu_blocks[0]
+            curve = run_one_solver(
+                **unit_kwargs, **run_kwargs, show_progress=show_progress
+            )
+            yield curve, get_sys_info()
+
+
+def run_benchmark(benchmark, solver_names=None, forced_solvers=None,
+                  dataset_names=None, objective_filters=None,
+                  max_runs=10, n_repetitions=1, timeout=100,
+                  total_timeout=None, n_jobs=1, backend='loky', executor=None,
+                  output_format='csv', resume=None, eval_mode='sync',
+                  sampling='geometric', isolation='none', n_threads=None,
+                  pin_cpus=False, scaling_threads=None, n_warmup=0,
+                  n_trials=1, plot_result=True, html=True, show_progress=True,
+                  pdb=False):
+    """Run full benchmark.
+
+    Parameters
+    ----------
+    benchmark : benchopt.Benchmark object
+        Object to represent the benchmark.
+    solver_names : list | None
+        List of solvers to include in the benchmark. If None
+        all solvers available are run.
+    forced_solvers : list | None
+        List of solvers to include in the benchmark and for
+        which one forces recomputation.
+    dataset_names : list | None
+        List of datasets to include. If None all available
+        datasets are used.
+    objective_filters : list | None
+        Filters to select specific objective parameters. If None,
+        all objective parameters are tested
+    max_runs : int
+        The maximum number of solver runs to perform to estimate
+        the convergence curve.
+    n_repetitions : int
+        The number of repetitions to run. Defaults to 1.
+    timeout : float
+        The maximum duration in seconds of the solver run.
+    total_timeout : float | None
+        If not None, the maximum duration in seconds of the whole benchmark.
+        The time left is shared equally between the (dataset, objective,
+        solver) units that remain to be run, so the time not used by the
+        solvers that converge early is given to the next ones. The results
+        then have a ``budget_truncated`` column, set to True for the
+        repetitions stopped by this budget rather than by ``timeout``. With
+        an ``executor``, ``n_jobs`` should be set to its number of workers,
+        as it gives the number of units run concurrently.
+    n_jobs : int
+        Number of worker processes used to run the (dataset, objective,
+        solver) units in parallel. If set to 1 (default), the units are run
+        sequentially in the current process. The workers, as the processes
+        used for ``isolation``, share the data of the datasets through
+        memory-mapped files, see the ``cache_datasets`` setting.
+    backend : str in {'loky', 'multiprocessing', 'dask'}
+        Executor used to run the units when ``n_jobs > 1``. See
+        ``get_executor`` for details. Defaults to ``'loky'``.
+    executor : concurrent.futures.Executor | distributed.Client | None
+        If not None, run the units by submitting them to this executor
+        instead of creating one with ``n_jobs`` and ``backend``. This can be
+        used to run the benchmark on an existing dask cluster. The system
+        info of each machine running the units are stored in the metadata
+        of the results, see ``ResultWriter.add_sys_info``.
+    output_format : str in {'csv', 'parquet', 'feather'}
+        Format of the result file. The columnar formats ``parquet`` and
+        ``feather`` are faster to load for large results and require
+        ``pyarrow``. Defaults to ``'csv'``.
+    resume : str | Path | None
+        If not None, resume the run saved in this result file. The
+        repetitions of each (dataset, objective, solver) already in the file
+        are skipped and the new curves are appended to it. The format of the
+        file is kept and ``output_format`` is ignored.
+    eval_mode : str in {'sync', 'deferred', 'thread'}
+        How the objective is evaluated for solvers with the callback
+        strategy. With ``'sync'`` (default), it is evaluated in the callback,
+        which stalls the solver. With ``'deferred'``, the callback only
+        copies the iterates and they are evaluated by batches, less often.
+        With ``'thread'``, the copies are evaluated in order by a worker
+        thread while the solver runs.
+    sampling : str in {'geometric', 'time'}
+        How the stop values of the solvers are spaced. With ``'geometric'``
+        (default), they grow geometrically. With ``'time'``, they are chosen
+        to space the evaluations log-uniformly in time, so each solver uses
+        about ``max_runs`` evaluations until the timeout, whatever its speed.
+    isolation : str in {'none', 'repetition', 'solver'}
+        With ``'none'`` (default), the solvers are run in the process of the
+        runner, so a call to ``solver.run`` that does not return blocks the
+        benchmark. With ``'repetition'``, each repetition is run in a new
+        worker process, which is killed if the solver is still running after
+        the timeout. The curve computed before is kept. This has an overhead
+        to start the process and load the data, for each repetition. With
+        ``'solver'``, each solver class is run in its own long-lived worker
+        process, which receives the objective once per (dataset, objective)
+        and serves all the repetitions. The solvers are then also isolated
+        from the thread pools and caches of the others.
+    n_threads : int | None
+        Maximal number of threads of the native thread pools, such as BLAS or
+        OpenMP, used to run the solvers. Solvers can override it with their
+        ``threads`` attribute. If None (default), the threads are not
+        limited. In all cases, the numbers of threads used and of CPUs
+        available are stored in the ``n_threads_*`` and ``n_cpus`` columns of
+        the results.
+    pin_cpus : bool
+        If True, split the CPUs in ``n_jobs`` blocks and pin each solver to a
+        block not used by the other solvers running at the same time, so that
+        parallel runs do not compete for the same cores. Only available on
+        Linux. Defaults to False.
+    scaling_threads : list of int | None
+        If not None, run each solver once for each number of threads in the
+        list, to measure how it scales with the number of threads. The number
+        of threads is added to the solver names and stored in the
+        ``n_threads`` column of the results. The ``'scaling_curve'`` plot then
+        shows the speedup and parallel efficiency of each solver. It cannot be
+        used with ``n_threads``.
+    n_warmup : int
+        Number of runs of the solvers made before timing each stop value and
+        discarded, so the JIT compilation and the cold caches of the first
+        runs are not timed. Defaults to 0.
+    n_trials : int
+        Number of timed runs of the solvers for each stop value. The ``time``
+        stored is the median of the trials. If larger than 1, the results
+        also have the columns ``time_min``, ``time_mad`` (median absolute
+        deviation) and ``n_time_outliers``, the number of trials far from the
+        median, which indicates a noisy machine. Defaults to 1. ``n_warmup``
+        and ``n_trials`` are ignored for solvers with the callback strategy
+        and cannot be used with solvers setting ``warm_start=True``.
+    plot_result : bool
+        If set to True (default), display the result plot and save them in
+        the benchmark directory.
+    html : bool
+        If set to True (default), display the result plot in HTML, otherwise
+        in matplotlib figures, default is True.
+    show_progress : bool
+        If show_progress is set to True, display the progress of the benchmark.
+        This is ignored when ``n_jobs > 1``.
+    pdb : bool
+        It pdb is set to True, open a debugger on error.
+
+    Returns
+    -------
+    df : instance of pandas.DataFrame
+        The benchmark results. If multiple metrics were computed, each
+        one is stored in a separate column. If the number of metrics computed
+        by the objective is not the same for all parameters, the missing data
+        is set to `NaN`.
+    """
+    parallel = executor is not None or n_jobs != 1
+    if pdb and parallel:
+        raise ValueError("Cannot use option pdb to run in parallel.")
+    if isolation not in ISOLATIONS:
+        raise ValueError(
+            f"Unknown isolation '{isolation}'. Should be one of {ISOLATIONS}."
+        )
+    if pdb and isolation != 'none':
+        raise ValueError("Cannot use option pdb with isolation.")
+    if scaling_threads is not None:
+        if n_threads is not None:
+            raise ValueError(
+                "Cannot use both n_threads and scaling_threads."
+            )
+        if len(scaling_threads) == 0 or min(scaling_threads) < 1:
+            raise ValueError(
+                "scaling_threads should be a non-empty list of positive "
+                f"numbers of threads. Got {scaling_threads}."
+            )
+    completed = None
+    if resume is not None:
+        output_format = get_output_format(resume)
+        completed = get_completed_runs(resume)
+    check_output_format(output_format)
+    if eval_mode not in EVAL_MODES:
+        raise ValueError(
+            f"Unknown eval_mode '{eval_mode}'. Should be one of {EVAL_MODES}."
+        )
+    if sampling not in SAMPLINGS:
+        raise ValueError(
+            f"Unknown sampling '{sampling}'. Should be one of {SAMPLINGS}."
+        )
+    if n_warmup < 0 or n_trials < 1:
+        raise ValueError(
+            "n_warmup should be non-negative and n_trials positive. Got "
+            f"n_warmup={n_warmup} and n_trials={n_trials}."
+        )
+
+    # The data are stored on disk and loaded memory-mapped, so that the
+    # processes running the solvers share the same pages instead of each
+    # retrieving its own copy. Without the dataset cache, they are stored in
+    # a temporary folder removed at the end of the run.
+    data_cache_dir = tmp_data_dir = None
+    if benchmark.get_setting('cache_datasets'):
+        data_cache_dir = benchmark.get_dataset_cache_location()
+    elif parallel or isolation != 'none':
+        data_cache_dir = tmp_data_dir = Path(
+            tempfile.mkdtemp(prefix='benchopt_data_')
+        )
+
+    print("Benchopt is running")
+
+    all_runs = _list_solver_runs(
+        benchmark, solver_names=solver_names, forced_solvers=forced_solvers,
+        dataset_names=dataset_names, objective_filters=objective_filters,
+        n_repetitions=n_repetitions, completed=completed,
+        n_threads=n_threads, scaling_threads=scaling_threads,
+        data_cache_dir=data_cache_dir
+    )
+    curves = _run_all_solvers(
+        all_runs, n_jobs=n_jobs, backend=backend, executor=executor,
+        total_timeout=total_timeout, show_progress=show_progress,
+        benchmark=benchmark, max_runs=max_runs,
+        n_repetitions=n_repetitions, timeout=timeout, eval_mode=eval_mode,
+        sampling=sampling, isolation=isolation, pin_cpus=pin_cpus,
+        n_warmup=n_warmup, n_trials=n_trials, pdb=pdb
+    )
+
+    # Save output in the benchmark folder. Each curve is appended to the file
+    # once computed so the results are kept if the run is interrupted. The
+    # system info are stored once in a metadata file: ``sys_info`` describes
+    # the machine launching the run and ``sys_info_by_hardware`` the machines
+    # running the solvers, given by the ``hardware_key`` column.
+    if resume is not None:
+        save_file = Path(resume)
+    else:
+        timestamp = datetime.now().strftime('%Y-%m-%d_%Hh%Mm%S')
+        output_dir = benchmark.get_output_folder()
+        save_file = output_dir / f'benchopt_run_{timestamp}.{output_format}'
+    metadata = dict(sys_info=get_sys_info())
+    writer = ResultWriter(
+        save_file, metadata=metadata, resume=resume is not None
+    )
+    try:
+        with writer:
+            for curve, sys_info in curves:
+                writer.add_sys_info(sys_info)
+                writer.append(curve)
+    finally:
+        close_workers()
+        if tmp_data_dir is not None:
+            shutil.rmtree(tmp_data_dir, ignore_errors=True)
+
+    # Keep the cache under the size set in the benchmark config, if any.
+    cache_max_size = benchmark.get_setting('cache_max_size')
+    if cache_max_size is not None:
+        prune_cache(benchmark.get_cache_location(), max_size=cache_max_size)
+
+    if writer.n_rows == 0:
         print_normalize(colorify('No output produced.', RED))
         raise SystemExit(1)
-
-    # Save output in CSV file in the benchmark folder
-    timestamp = datetime.now().strftime('%Y-%m-%d_%Hh%Mm%S')
-    output_dir = benchmark.get_output_folder()
-    save_file = output_dir / f'benchopt_run_{timestamp}.csv'
-    df.to_csv(save_file)
     print(colorify(f'Saving result in: {save_file}', GREEN))
 
     if plot_result:
         from benchopt.plotting import plot_benchmark
-        plot_benchmark(save_file, benchmark, html=html)
+        kinds = None
+        if scaling_threads is not None:
+            kinds = benchmark.get_setting('plots')
+            if 'scaling_curve' not in kinds:
+                kinds = [*kinds, 'scaling_curve']
+        plot_benchmark(save_file, benchmark, kinds=kinds, html=html)
     return save_file
@@ -68,7 +68,7 @@ class StoppingCriterion():
         self.strategy = strategy
 
     def get_runner_instance(self, max_runs=1, timeout=None, progress_str=None,
-                            solver=None):
+                            solver=None, sampling='geometric'):
         """Copy the stopping criterion and set the parameters that depends on
         how benchopt runner is called.
 
@@ -84,6 +84,13 @@ class StoppingCriterion():
         solver : BaseSolver
             The solver for which this stopping criterion is called. Used to get
             overridden ``stopping_strategy`` and ``get_next``.
+        sampling : str in {'geometric', 'time'}
+            How the stop values are spaced. With ``'geometric'``, they grow
+            geometrically by ``rho``. With ``'time'``, they are chosen to
+            space the evaluations log-uniformly in time until the timeout, see
+            ``get_next_time_stop_val``. The ``'geometric'`` sampling is used
+            for the ``'tolerance'`` strategy, without timeout or when the
+            solver implements ``get_next``.
 
         Returns
         -------
@@ -138,6 +145,12 @@ class StoppingCriterion():
 
             stopping_criterion.get_next_stop_val = solver.get_next
 
+        # The time sampling needs a timeout and to relate stop_val to time.
+        if (strategy == 'tolerance' or timeout is None
+                or hasattr(solver, 'get_next')):
+            sampling = 'geometric'
+        stopping_criterion.sampling = sampling
+
         # Store running arguments
         if timeout is not None:
             stopping_criterion._deadline = time.time() + timeout
@@ -147,7 +160,7 @@ class StoppingCriterion():
 
         return stopping_criterion
 
-    def should_stop_solver(self, stop_val, cost_curve):
+    def should_stop_solver(self, stop_val, cost_curve, timestamp=None):
         """Base call to check if we should stop running a solver.
 
         This base call checks for the timeout and the max number of runs.
@@ -162,6 +175,11 @@ class StoppingCriterion():
         cost_curve : list of dict
             List of dict containing the values associated to the objective at
             each evaluated points.
+        timestamp : float | None
+            Time, as given by ``time.time``, at which the last point of the
+            curve was reached by the solver. The timeout is checked against
+            it, so the points evaluated after the deadline but reached before
+            are kept. If None, the current time is used.
 
         Returns
         -------
@@ -184,10 +202,12 @@ class StoppingCriterion():
 
         # default value for is_flat
         is_flat = False
+        if timestamp is None:
+            timestamp = time.time()
 
         # check the different conditions:
         #     timeout / max_runs / diverging / stopping_criterion
-        if self._deadline is not None and time.time() > self._deadline:
+        if self._deadline is not None and timestamp > self._deadline:
             stop = True
             status = 'timeout'
 
@@ -221,7 +241,31 @@ class StoppingCriterion():
             if DEBUG:
                 print("DEBUG - curve is flat -> increasing rho:", self.rho)
 
-        return stop, status, self.get_next_stop_val(stop_val)
+        if self.sampling == 'time':
+            next_stop_val = self.get_next_time_stop_val(stop_val, cost_curve)
+        else:
+            next_stop_val = self.get_next_stop_val(stop_val)
+        return stop, status, next_stop_val
+
+    def is_budget_reached(self, n_eval):
+        """Check the timeout and the max number of runs.
+
+        This does not require the objective values, so it can be checked
+        before evaluating the objective on the iterates.
+
+        Parameters
+        ----------
+        n_eval : int
+            Number of evaluations, excluding the initial one.
+
+        Returns
+        -------
+        reached : bool
+            Whether the solver will be stopped because of the timeout or the
+            max number of runs.
+        """
+        timeout = self._deadline is not None and time.time() > self._deadline
+        return timeout or n_eval >= self.max_runs
 
     def show_progress(self, progress):
         """Display progress in the CLI interface."""
@@ -264,10 +308,42 @@ class StoppingCriterion():
         )
         runner_kwargs = dict(
             max_runs=self.max_runs, timeout=self.timeout,
-            progress_str=self.progress_str, solver=self.solver
+            progress_str=self.progress_str, solver=self.solver,
+            sampling=self.sampling
         )
         return self._reconstruct, (self.__class__, kwargs, runner_kwargs)
 
+    def get_next_time_stop_val(self, stop_val, cost_curve):
+        """Get the next stop_val to space the evaluations in time.
+
+        The remaining evaluations are spaced log-uniformly in time, between
+        the time of the last evaluation and the timeout. The stop_val needed
+        to reach the next time is predicted with the time per iteration of the
+        last evaluation. Each solver thus uses about ``max_runs`` evaluations,
+        whatever its speed.
+
+        Parameters
+        ----------
+        stop_val : int
+            Number of iterations of the last evaluation.
+        cost_curve : list of dict
+            List of dict containing the values associated to the objective at
+            each evaluated points.
+
+        Returns
+        -------
+        next_stop_val : int
+            Number of iterations for the next evaluation.
+        """
+        elapsed = cost_curve[-1]['time']
+        n_left = self.max_runs - (len(cost_curve) - 1)
+        if stop_val == 0 or elapsed <= 0 or n_left <= 0:
+            return stop_val + 1
+
+        next_time = elapsed * (self.timeout / elapsed) ** (1 / n_left)
+        next_stop_val = math.ceil(next_time * stop_val / elapsed)
+        return max(stop_val + 1, min(next_stop_val, MAX_ITER))
+
     def get_next_stop_val(self, stop_val):
         if self.strategy == "tolerance":
             return min(1, max(stop_val / self.rho, MIN_TOL))
@@ -2,6 +2,7 @@ import re
 
 from pathlib import Path
 from benchopt.benchmark import Benchmark
+from benchopt.utils.results import get_metadata_file
 from benchopt.utils.stream_redirection import SuppressStd
 
 # Default benchmark
@@ -9,6 +10,9 @@ TEST_BENCHMARK_DIR = Path(__file__).parent / 'test_benchmarks'
 DUMMY_BENCHMARK_PATH = TEST_BENCHMARK_DIR / 'dummy_benchmark'
 REQUIREMENT_BENCHMARK_PATH = TEST_BENCHMARK_DIR / 'requirement_benchmark'
 
+# Pattern to find the result files in the output of a run.
+RESULT_FILE_PATTERN = r'Saving result in: (.*\.(?:csv|parquet|feather))'
+
 # Pattern to select specific datasets or solvers.
 SELECT_ONE_SIMULATED = r'simulated*500*rho=0]'
 SELECT_ONE_PGD = r'python-pgd*step_size=1]'
@@ -30,6 +34,36 @@ except Exception:
     TEST_DATASET = None
 
 
+def get_test_objective(reg=1):
+    "Return the test objective, set with the test dataset."
+    dataset = TEST_DATASET.get_instance()
+    objective = TEST_OBJECTIVE.get_instance(reg=reg)
+    objective.set_dataset(dataset)
+    return objective
+
+
+def run_dummy_benchmark(**kwargs):
+    """Run the dummy benchmark on one solver, dataset and objective.
+
+    The keyword arguments are passed to ``run_benchmark`` and override the
+    default selection. Returns the results loaded with ``load_results`` and
+    the ``CaptureRunOutput`` of the run. The result files are removed.
+    """
+    from benchopt.runner import run_benchmark
+    from benchopt.utils.results import load_results
+
+    run_kwargs = dict(
+        solver_names=[SELECT_ONE_PGD], dataset_names=[SELECT_ONE_SIMULATED],
+        objective_filters=[SELECT_ONE_OBJECTIVE], max_runs=1,
+        n_repetitions=1, plot_result=False
+    )
+    run_kwargs.update(kwargs)
+    with CaptureRunOutput() as out:
+        save_file = run_benchmark(DUMMY_BENCHMARK, **run_kwargs)
+        df = load_results(save_file)
+    return df, out
+
+
 class CaptureRunOutput(object):
     """Context to capture run cmd output and files.
     """
@@ -52,13 +86,18 @@ class CaptureRunOutput(object):
         self.output = self.out.output
 
         # Make sure to delete all the result that created by the run command.
-        self.result_files = re.findall(
-            r'Saving result in: (.*\.csv)', self.output
-        )
+        # A resumed run saves its results in the same file.
+        self.result_files = list(dict.fromkeys(re.findall(
+            RESULT_FILE_PATTERN, self.output
+        )))
         if len(self.result_files) >= 1:
             for result_file in self.result_files:
                 result_path = Path(result_file)
-                result_path.unlink()  # remove csv file
+                result_path.unlink()  # remove result file
+                # remove the metadata file associated with this results
+                metadata_file = get_metadata_file(result_path)
+                if metadata_file.exists():
+                    metadata_file.unlink()
                 result_dir = result_path.parents[0]
                 stem = result_path.stem
                 for html_file in result_dir.glob(f'*{stem}*.html'):
@@ -32,6 +32,20 @@ def test_benchmark_objective(benchmark, dataset_simu):
         "dict containing a scalar associated to `objective_value`."
     )
 
+    # check that computing the objective for a batch of estimates gives the
+    # same result as computing it for each estimate.
+    if isinstance(beta_hat, np.ndarray):
+        betas = np.stack([beta_hat, beta_hat + 1])
+    else:
+        betas = [beta_hat, beta_hat]
+    objective_dicts = objective._call_batch(betas)
+    assert len(objective_dicts) == len(betas)
+    for beta, batch_dict in zip(betas, objective_dicts):
+        assert batch_dict == pytest.approx(objective(beta)), (
+            "`Objective.compute_batch` should return the same values as "
+            "`Objective.compute` for each estimate."
+        )
+
 
 def test_dataset_class(benchmark, dataset_class):
     """Check that all dataset_class respects the public API"""
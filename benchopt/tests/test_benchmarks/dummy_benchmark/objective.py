@@ -1,4 +1,8 @@
 from benchopt.base import BaseObjective
+from benchopt import safe_import_context
+
+with safe_import_context() as import_ctx:
+    import numpy as np
 
 
 class Objective(BaseObjective):
@@ -19,7 +23,18 @@ class Objective(BaseObjective):
     def compute(self, beta):
         diff = self.y - self.X.dot(beta)
         objective_value = .5 * diff.dot(diff) + self.lmbd * abs(beta).sum()
-
+        return self._format(objective_value)
+
+    # Compute the objective for all the betas with one matrix product.
+    def compute_batch(self, betas):
+        betas = np.asarray(betas)
+        diff = self.y[:, None] - self.X.dot(betas.T)
+        objective_values = (
+            .5 * (diff ** 2).sum(axis=0) + self.lmbd * abs(betas).sum(axis=1)
+        )
+        return [self._format(v) for v in objective_values]
+
+    def _format(self, objective_value):
         # To test for multiple type of return value, makes this depend on the
         # parameter:
         #   - reg == .1: Return a scalar
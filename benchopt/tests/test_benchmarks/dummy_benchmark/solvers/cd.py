@@ -30,6 +30,7 @@ class Solver(BaseSolver):
         # use Fortran order to compute gradient on contiguous columns
         self.X, self.y, self.lmbd = np.asfortranarray(X), y, lmbd
 
+    def warmup(self):
         # Make sure we cache the numba compilation.
         self.run(1)
 
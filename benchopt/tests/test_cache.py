@@ -0,0 +1,173 @@
+import pytest
+
+from benchopt.tests import TEST_DATASET
+from benchopt.tests import TEST_OBJECTIVE
+
+
+def test_dataset_cache(tmp_path):
+    import numpy as np
+    from scipy import sparse
+
+    calls = []
+
+    class CountingDataset(TEST_DATASET):
+        def get_data(self):
+            calls.append(self)
+            rng = np.random.RandomState(0)
+            X = sparse.random(10, 5, density=.5, format='csc', random_state=0)
+            return 5, dict(X=X, y=rng.randn(10), lmbd=.1)
+
+    def get_data():
+        dataset = CountingDataset.get_instance()
+        dataset._cache_dir = tmp_path
+        return dataset, dataset._get_data()
+
+    # The data are retrieved once per instance, then loaded memory-mapped.
+    dataset, (dimension, data) = get_data()
+    assert dataset._get_data() is dataset._get_data()
+    assert len(calls) == 1
+    assert dimension == (5,)
+    assert isinstance(data['y'], np.memmap)
+    assert not data['X'].data.flags.owndata
+    assert data['lmbd'] == .1
+
+    # The next instances load the data from the cache.
+    _, (_, data_cached) = get_data()
+    assert len(calls) == 1
+    np.testing.assert_array_equal(data_cached['y'], data['y'])
+    assert (data_cached['X'] != data['X']).nnz == 0
+    assert data_cached['X'].format == 'csc'
+
+    # Changing the data inplace does not change the cache.
+    data_cached['y'][:] = 0
+    _, (_, data_cached) = get_data()
+    np.testing.assert_array_equal(data_cached['y'], data['y'])
+
+
+def _get_data_file(objective):
+    # Return the file backing the data of the objective in a worker.
+    X = objective._dataset._get_data()[1]['X']
+    return getattr(X, 'filename', None)
+
+
+def test_dataset_shared_with_workers(tmp_path):
+    from benchopt.utils.isolation import WorkerProcess
+
+    dataset = TEST_DATASET.get_instance()
+    dataset._cache_dir = tmp_path
+    objective = TEST_OBJECTIVE.get_instance(reg=1)
+    objective.set_dataset(dataset)
+
+    # The worker maps the file stored by the main process, instead of
+    # retrieving the data again.
+    X = dataset._get_data()[1]['X']
+    with WorkerProcess(objective=objective) as process:
+        assert process.call(_get_data_file) == X.filename
+    assert X.filename.startswith(str(tmp_path))
+
+
+def test_prune_cache(tmp_path):
+    import os
+    import json
+    import time
+    from benchopt.utils.cache_manager import parse_size
+    from benchopt.utils.cache_manager import prune_cache
+    from benchopt.utils.cache_manager import list_cache_entries
+
+    assert parse_size('10GB') == parse_size('10G') == 10 ** 10
+    assert parse_size('1.5k') == 1500
+    with pytest.raises(ValueError, match="Could not parse"):
+        parse_size('ten')
+
+    # Create 3 joblib entries of 1000 bytes, the first one being the least
+    # recently used.
+    now = time.time()
+    for i in range(3):
+        entry = tmp_path / 'runner' / 'run_one_to_cvg' / str(i)
+        entry.mkdir(parents=True)
+        (entry / 'output.pkl').write_bytes(b'0' * 1000)
+        with open(entry / 'metadata.json', 'w') as f:
+            json.dump(dict(input_args=dict(meta=str(dict(
+                data_name=f'data{i}', solver_name='solver', dimension=(1,)
+            )))), f)
+        last_access = now - (3 - i) * 24 * 3600
+        os.utime(entry / 'output.pkl', (last_access, last_access))
+
+    entries = list_cache_entries(tmp_path)
+    assert [e['dataset'] for e in entries] == ['data0', 'data1', 'data2']
+    assert {e['solver'] for e in entries} == {'solver'}
+
+    removed = prune_cache(tmp_path, max_age=2.5)
+    assert [e['dataset'] for e in removed] == ['data0']
+    removed = prune_cache(tmp_path, max_size='1.5KB')
+    assert [e['dataset'] for e in removed] == ['data1']
+    assert [e['dataset'] for e in list_cache_entries(tmp_path)] == ['data2']
+
+
+class _InMemoryS3Client:
+    "Minimal stand-in for a boto3 S3 client, storing the objects in a dict."
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self):
+        self.objects = {}
+
+    def put_object(self, Bucket, Key, Body):
+        from datetime import datetime, timezone
+        self.objects[Bucket, Key] = (bytes(Body), datetime.now(timezone.utc))
+
+    def get_object(self, Bucket, Key):
+        import io
+        if (Bucket, Key) not in self.objects:
+            raise self.exceptions.NoSuchKey(Key)
+        return {'Body': io.BytesIO(self.objects[Bucket, Key][0])}
+
+    def copy_object(self, Bucket, Key, CopySource):
+        src = CopySource['Bucket'], CopySource['Key']
+        self.objects[Bucket, Key] = self.objects[src]
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop((Bucket, Key), None)
+
+    def list_objects_v2(self, Bucket, Prefix, MaxKeys=1000, **kwargs):
+        contents = [
+            dict(Key=key, Size=len(body), LastModified=date)
+            for (bucket, key), (body, date) in sorted(self.objects.items())
+            if bucket == Bucket and key.startswith(Prefix)
+        ]
+        return dict(Contents=contents[:MaxKeys], IsTruncated=False)
+
+
+def test_object_store_run_cache():
+    from joblib import Memory
+    from benchopt.utils.store_backends import get_run_cache_backend
+
+    assert get_run_cache_backend('s3://bucket/prefix') == 's3'
+    assert get_run_cache_backend('/shared/cache') == 'local'
+
+    client = _InMemoryS3Client()
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x ** 2
+
+    # Two memories sharing the same store, as on two machines.
+    for _ in range(2):
+        mem = Memory(
+            location='s3://bucket/prefix', backend='s3', verbose=0,
+            backend_options=dict(client=client)
+        )
+        assert mem.cache(square)(3) == 9
+    assert calls == [3]
+    assert all(
+        bucket == 'bucket' and key.startswith('prefix/joblib/')
+        for bucket, key in client.objects
+    )
+
+    mem.reduce_size(bytes_limit=0)
+    assert not any(key.endswith('output.pkl') for _, key in client.objects)
+    assert mem.cache(square)(3) == 9
+    assert calls == [3, 3]
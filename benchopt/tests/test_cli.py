@@ -6,10 +6,12 @@ import pytest
 from click.shell_completion import ShellComplete
 
 from benchopt.plotting import PLOT_KINDS
+from benchopt.utils.results import get_metadata_file
 from benchopt.utils.stream_redirection import SuppressStd
 
 
 from benchopt.tests import CaptureRunOutput
+from benchopt.tests import RESULT_FILE_PATTERN
 from benchopt.tests import SELECT_ONE_PGD
 from benchopt.tests import SELECT_ONE_SIMULATED
 from benchopt.tests import SELECT_ONE_OBJECTIVE
@@ -22,6 +24,7 @@ from benchopt.tests import REQUIREMENT_BENCHMARK_PATH
 from benchopt.cli.main import run
 from benchopt.cli.main import install
 from benchopt.cli.process_results import plot
+from benchopt.cli.helpers import cache
 from benchopt.cli.helpers import check_install
 
 
@@ -127,6 +130,50 @@ class TestRunCmd:
         # Make sure the results were saved in a result file
         assert len(out.result_files) == 1, out.output
 
+    def test_benchopt_run_parallel(self):
+        with CaptureRunOutput() as out:
+            run([str(DUMMY_BENCHMARK_PATH), '-l', '-d', SELECT_ONE_SIMULATED,
+                 '-f', 'python-pgd*', '-n', '1', '-r', '1', '-o',
+                 SELECT_ONE_OBJECTIVE, '-j', '2', '--no-plot'],
+                'benchopt', standalone_mode=False)
+
+        # The output of each solver is displayed once, with its full name
+        out.check_output(r'Simulated.* \| Dummy Sparse Regression.* \| '
+                         r'Python-PGD\[step_size=1\]:.*done', repetition=1)
+        out.check_output(r'Python-PGD\[step_size=1.5\]:', repetition=1)
+
+        # Make sure the results were saved in a result file
+        assert len(out.result_files) == 1, out.output
+
+    def test_benchopt_run_dask(self):
+        pytest.importorskip('distributed')
+        with CaptureRunOutput() as out:
+            run([str(DUMMY_BENCHMARK_PATH), '-l', '-d', SELECT_ONE_SIMULATED,
+                 '-s', SELECT_ONE_PGD, '-n', '1', '-r', '1', '-o',
+                 SELECT_ONE_OBJECTIVE, '-j', '2', '--backend', 'dask',
+                 '--no-plot'], 'benchopt', standalone_mode=False)
+
+        out.check_output(r'Python-PGD\[step_size=1\]:.*done', repetition=1)
+        assert len(out.result_files) == 1, out.output
+
+    def test_benchopt_run_resume(self):
+        run_cmd = [str(DUMMY_BENCHMARK_PATH), '-l', '-d', SELECT_ONE_SIMULATED,
+                   '-s', 'python-pgd*', '-n', '1', '-r', '1', '-o',
+                   SELECT_ONE_OBJECTIVE, '--no-plot']
+        with CaptureRunOutput() as out:
+            run(run_cmd, 'benchopt', standalone_mode=False)
+            result_file = DUMMY_BENCHMARK.get_result_file()
+
+            # Resume from the result file name, without the suffix
+            run(run_cmd + ['-f', SELECT_ONE_PGD, '--resume', result_file.stem],
+                'benchopt', standalone_mode=False)
+
+        out.check_output(r'Python-PGD\[step_size=1\]:.*done \(resumed\)',
+                         repetition=1)
+        out.check_output(r'Python-PGD\[step_size=1.5\]:.*done \(resumed\)',
+                         repetition=1)
+        assert len(out.result_files) == 1, out.output
+
     def test_benchopt_run_in_env(self, test_env_name):
         with CaptureRunOutput() as out:
             with pytest.raises(SystemExit, match='False'):
@@ -301,7 +348,7 @@ class TestPlotCmd:
                  '-s', SELECT_ONE_PGD, '-n', '2', '-r', '1', '-o',
                  SELECT_ONE_OBJECTIVE, '--no-plot'], 'benchopt',
                 standalone_mode=False)
-        result_files = re.findall(r'Saving result in: (.*\.csv)', out.output)
+        result_files = re.findall(RESULT_FILE_PATTERN, out.output)
         assert len(result_files) == 1, out.output
         result_file = result_files[0]
         cls.result_file = result_file
@@ -310,6 +357,7 @@ class TestPlotCmd:
     def teardown_class(cls):
         "Make sure at least one result file is available"
         Path(cls.result_file).unlink()
+        get_metadata_file(cls.result_file).unlink()
 
     def test_plot_invalid_file(self):
 
@@ -351,3 +399,34 @@ class TestPlotCmd:
         _test_shell_completion(
             run, [str(DUMMY_BENCHMARK_PATH), '-d'], DATASET_COMPLETION_CASES
         )
+
+
+class TestCacheCmd:
+
+    def test_cache_info(self, tmp_path, monkeypatch):
+        # Run the benchmark with an empty cache, to know its entries.
+        monkeypatch.setenv('BENCHOPT_CACHE_LOCATION', str(tmp_path))
+        run_cmd = [str(DUMMY_BENCHMARK_PATH), '-l', '-d', SELECT_ONE_SIMULATED,
+                   '-s', SELECT_ONE_PGD, '-n', '1', '-r', '1',
+                   '-o', SELECT_ONE_OBJECTIVE, '--no-plot']
+        with CaptureRunOutput():
+            run(run_cmd, 'benchopt', standalone_mode=False)
+
+        with SuppressStd() as out:
+            cache(['info', str(DUMMY_BENCHMARK_PATH)], 'benchopt',
+                  standalone_mode=False)
+        assert re.search(r"\d+ entries", out.output), out.output
+        by_solver = out.output.split("By solver:\n")[1].split("By dataset")[0]
+        assert re.fullmatch(
+            r"\s+\S+B  Python-PGD\[step_size=1\]\n", by_solver
+        ), out.output
+
+    def test_cache_ls(self):
+        with SuppressStd():
+            cache(['ls', str(DUMMY_BENCHMARK_PATH)], 'benchopt',
+                  standalone_mode=False)
+
+    def test_cache_prune_no_limit(self):
+        with pytest.raises(click.UsageError, match="--max-size"):
+            cache(['prune', str(DUMMY_BENCHMARK_PATH)], 'benchopt',
+                  standalone_mode=False)
@@ -0,0 +1,123 @@
+import pytest
+
+from benchopt.tests import CaptureRunOutput
+from benchopt.tests import SELECT_ONE_PGD
+from benchopt.tests import DUMMY_BENCHMARK
+from benchopt.tests import get_test_objective
+from benchopt.tests import run_dummy_benchmark
+
+
+def _sleep(duration):
+    import time
+    time.sleep(duration)
+    return duration
+
+
+def test_worker_process_timeout():
+    import time
+    from benchopt.utils.isolation import WorkerProcess
+
+    with WorkerProcess() as process:
+        assert process.call(_sleep, duration=0) == 0
+
+        # The call is killed once the deadline and the grace time are passed
+        t_start = time.time()
+        with pytest.raises(TimeoutError):
+            process.call(_sleep, deadline=t_start, duration=60)
+        assert time.time() - t_start < 30
+        assert not process._process.is_alive()
+
+
+@pytest.mark.parametrize('isolation', ['repetition', 'solver'])
+def test_isolation(isolation):
+    from benchopt.utils.isolation import _WORKERS
+
+    df, _ = run_dummy_benchmark(
+        solver_names=[SELECT_ONE_PGD, 'python-pgd-with-cb*acc*=False]'],
+        forced_solvers=[SELECT_ONE_PGD], max_runs=2, n_repetitions=2,
+        isolation=isolation
+    )
+
+    assert df.groupby('solver_name')['stop_val'].count().to_dict() == {
+        'Python-PGD-with-cb[use_acceleration=False]': 6,
+        'Python-PGD[step_size=1]': 6,
+    }
+    # The long-lived workers are stopped at the end of the run
+    assert len(_WORKERS) == 0
+
+
+def _get_value(value):
+    return value
+
+
+def test_worker_set_state():
+    from benchopt.utils.isolation import WorkerProcess
+
+    # A new state is sent even if it reuses the id of a freed object.
+    with WorkerProcess(value=[0]) as process:
+        for i in range(1, 10):
+            process.set_state(value=[i])
+            assert process.call(_get_value) == [i]
+
+
+def test_get_worker():
+    from benchopt.utils.isolation import get_worker, close_workers
+
+    try:
+        worker = get_worker('sleep', duration=0)
+        assert worker.call(_sleep) == 0
+
+        # The same worker is reused, with the new state
+        assert get_worker('sleep', duration=0.1) is worker
+        assert worker.call(_sleep) == 0.1
+
+        # A new worker replaces the killed one
+        worker.kill()
+        new_worker = get_worker('sleep', duration=0)
+        assert new_worker is not worker and new_worker.call(_sleep) == 0
+    finally:
+        close_workers()
+
+
+_SET_OBJECTIVE_CALLS = []
+
+
+def _count_set_objective(solver, **state):
+    # Count the calls to set_objective of the solver class in the worker.
+    set_objective = type(solver).set_objective
+
+    def counting_set_objective(self, **kwargs):
+        _SET_OBJECTIVE_CALLS.append(1)
+        return set_objective(self, **kwargs)
+    type(solver).set_objective = counting_set_objective
+
+
+def _get_set_objective_calls(**state):
+    return len(_SET_OBJECTIVE_CALLS)
+
+
+def test_worker_state_sent_once():
+    from benchopt.runner import run_one_solver
+    from benchopt.utils.isolation import _WORKERS
+    from benchopt.utils.isolation import get_worker, close_workers
+
+    objective = get_test_objective()
+    solver = [s for s in DUMMY_BENCHMARK.get_solvers()
+              if s.name == 'Python-PGD-with-cb'][0].get_instance()
+    solver._set_objective(objective)
+
+    try:
+        worker = get_worker(type(solver), objective=objective, solver=solver)
+        worker.call(_count_set_objective)
+
+        # All the repetitions use the objective and the solver of the worker,
+        # which are not sent again.
+        with CaptureRunOutput():
+            run_one_solver(
+                DUMMY_BENCHMARK, objective, solver, meta={}, max_runs=2,
+                n_repetitions=4, timeout=100, isolation='solver'
+            )
+        assert _WORKERS[type(solver)] is worker
+        assert worker.call(_get_set_objective_calls) == 0
+    finally:
+        close_workers()
@@ -0,0 +1,101 @@
+import pytest
+import pandas as pd
+
+from benchopt.runner import run_benchmark
+from benchopt.tests import CaptureRunOutput
+from benchopt.tests import SELECT_ONE_PGD
+from benchopt.tests import SELECT_ONE_SIMULATED
+from benchopt.tests import SELECT_ONE_OBJECTIVE
+from benchopt.tests import DUMMY_BENCHMARK
+
+
+@pytest.mark.parametrize('output_format', ['parquet', 'feather'])
+def test_output_format(output_format):
+    pytest.importorskip('pyarrow')
+    from benchopt.utils.results import load_results
+
+    with CaptureRunOutput():
+        save_file = run_benchmark(
+            DUMMY_BENCHMARK, solver_names=[SELECT_ONE_PGD],
+            dataset_names=[SELECT_ONE_SIMULATED],
+            objective_filters=[SELECT_ONE_OBJECTIVE],
+            max_runs=2, n_repetitions=1, output_format=output_format,
+            plot_result=False
+        )
+        assert save_file.suffix == f'.{output_format}'
+
+        # The format is detected when looking for the file and loading it
+        assert DUMMY_BENCHMARK.get_result_file(save_file.stem) == save_file
+        df = load_results(save_file)
+        assert df['time'].dtype == float
+        assert 'sys_info' in df.attrs
+
+
+def test_output_format_invalid():
+    with pytest.raises(ValueError, match="Unknown output format"):
+        run_benchmark(DUMMY_BENCHMARK, output_format='xlsx')
+
+
+@pytest.mark.parametrize('output_format', ['csv', 'parquet'])
+def test_result_writer(tmp_path, output_format):
+    if output_format != 'csv':
+        pytest.importorskip('pyarrow')
+    from benchopt.utils.results import ResultWriter
+    from benchopt.utils.results import load_results
+
+    curves = [
+        [dict(solver_name='a', time=t, objective_value=1.) for t in range(3)],
+        [dict(solver_name='b', time=1., objective_value=2., objective_v=3.)],
+        [dict(solver_name='c', time=1.)],
+    ]
+    result_file = tmp_path / f'results.{output_format}'
+    with ResultWriter(result_file, metadata=dict(sys_info={})) as writer:
+        for i, curve in enumerate(curves):
+            writer.append(curve)
+
+            # The partial results can be loaded while the run is going on
+            df = load_results(tmp_path / 'results.csv')
+            expected = pd.DataFrame(sum(curves[:i + 1], []))
+            pd.testing.assert_frame_equal(
+                df.drop(columns='Unnamed: 0'), expected
+            )
+            assert df.attrs == dict(sys_info={})
+
+    df = load_results(result_file)
+    if output_format == 'csv':
+        df = df.drop(columns='Unnamed: 0')
+    else:
+        assert not (tmp_path / 'results.csv').exists()
+    pd.testing.assert_frame_equal(df, pd.DataFrame(sum(curves, [])))
+    assert df.attrs == dict(sys_info={})
+
+
+def test_result_writer_interrupted(tmp_path):
+    pytest.importorskip('pyarrow')
+    from benchopt.utils.results import ResultWriter
+    from benchopt.utils.results import load_results
+    from benchopt.utils.results import get_completed_runs
+
+    def get_curve(idx_rep):
+        return [dict(
+            data_name='d', objective_name='o', solver_name='s',
+            idx_rep=idx_rep, time=1.
+        )]
+
+    # On error, the partial results are still converted to the output format
+    result_file = tmp_path / 'results.parquet'
+    with pytest.raises(RuntimeError):
+        with ResultWriter(result_file, metadata={}) as writer:
+            writer.append(get_curve(0))
+            raise RuntimeError()
+    assert not (tmp_path / 'results.csv').exists()
+    assert get_completed_runs(result_file) == {('d', 'o', 's'): {0}}
+
+    # If the process is killed, the run is resumed from the stream file
+    writer = ResultWriter(result_file, metadata={}, resume=True)
+    writer.append(get_curve(1))
+    assert get_completed_runs(result_file) == {('d', 'o', 's'): {0, 1}}
+    with ResultWriter(result_file, metadata={}, resume=True) as writer:
+        writer.append(get_curve(2))
+    assert not (tmp_path / 'results.csv').exists()
+    assert list(load_results(result_file)['idx_rep']) == [0, 1, 2]
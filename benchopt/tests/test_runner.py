@@ -1,6 +1,22 @@
+import time
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pandas as pd
+
+from benchopt.runner import run_benchmark
+from benchopt.tests import CaptureRunOutput
+from benchopt.tests import SELECT_ONE_PGD
+from benchopt.tests import SELECT_ONE_SIMULATED
+from benchopt.tests import SELECT_ONE_OBJECTIVE
+from benchopt.tests import DUMMY_BENCHMARK
 from benchopt.tests import TEST_SOLVER
 from benchopt.tests import TEST_DATASET
 from benchopt.tests import TEST_OBJECTIVE
+from benchopt.tests import run_dummy_benchmark
+from benchopt.tests import get_test_objective
 
 
 def test_skip_api(capsys):
@@ -21,3 +37,456 @@ def test_skip_api(capsys):
     skip, reason = solver._set_objective(objective)
     assert not skip
     assert reason is None
+
+
+def test_reconstruct_dataset_once():
+    # Datasets unpickled in workers should only load their data once.
+    dataset = TEST_DATASET.get_instance()
+    dataset_1 = pickle.loads(pickle.dumps(dataset))
+    dataset_2 = pickle.loads(pickle.dumps(dataset))
+    assert dataset_1 is dataset_2
+    assert dataset_1._get_data() is dataset_2._get_data()
+
+    objective = TEST_OBJECTIVE.get_instance(reg=1)
+    objective.set_dataset(dataset)
+    solver = TEST_SOLVER.get_instance()
+    solver._set_objective(objective)
+
+    solver_1 = pickle.loads(pickle.dumps(solver))
+    assert str(solver_1) == str(solver)
+    assert solver_1._objective._dataset is dataset_1
+
+
+def test_run_benchmark_executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        df, out = run_dummy_benchmark(n_repetitions=2, executor=executor)
+
+    out.check_output(r'Python-PGD\[step_size=1\]:.*done', repetition=1)
+    assert set(df['idx_rep']) == {0, 1}
+
+
+def test_resume():
+    from benchopt.utils.results import load_results
+
+    run_kwargs = dict(
+        solver_names=[SELECT_ONE_PGD], dataset_names=[SELECT_ONE_SIMULATED],
+        objective_filters=[SELECT_ONE_OBJECTIVE], max_runs=1,
+        plot_result=False
+    )
+    with CaptureRunOutput() as out:
+        save_file = run_benchmark(
+            DUMMY_BENCHMARK, n_repetitions=1, **run_kwargs
+        )
+        df = load_results(save_file)
+
+        # Only the missing repetition is run and appended to the same file
+        assert run_benchmark(
+            DUMMY_BENCHMARK, n_repetitions=2, resume=save_file, **run_kwargs
+        ) == save_file
+        df_resumed = load_results(save_file)
+
+        # Nothing is run when all the repetitions are done
+        run_benchmark(
+            DUMMY_BENCHMARK, n_repetitions=2, resume=save_file, **run_kwargs
+        )
+        df_done = load_results(save_file)
+
+    out.check_output(r'Python-PGD\[step_size=1\]:.*done \(resumed\)',
+                     repetition=1)
+    assert set(df['idx_rep']) == {0}
+    assert set(df_resumed['idx_rep']) == {0, 1}
+    pd.testing.assert_frame_equal(df_resumed.iloc[:len(df)], df)
+    pd.testing.assert_frame_equal(df_done, df_resumed)
+
+
+def test_warm_start():
+    import numpy as np
+    from benchopt.runner import run_one_to_cvg
+
+    objective = get_test_objective()
+
+    class WarmStartSolver(TEST_SOLVER):
+        warm_start = True
+
+        def set_objective(self, X, y, lmbd):
+            super().set_objective(X, y, lmbd)
+            self.w = np.zeros(X.shape[1])
+            self.n_iters = []
+
+        def run(self, n_iter):
+            self.n_iters.append(n_iter)
+            L = np.linalg.norm(self.X) ** 2
+            for _ in range(n_iter):
+                self.w -= self.X.T @ (self.X @ self.w - self.y) / L
+                self.w = self.st(self.w, self.lmbd / L)
+
+    curves = []
+    for solver in [TEST_SOLVER.get_instance(), WarmStartSolver.get_instance()]:
+        solver._set_objective(objective)
+        stopping_criterion = solver.stopping_criterion.get_runner_instance(
+            max_runs=10, timeout=None, solver=solver
+        )
+        curve, _ = run_one_to_cvg(
+            DUMMY_BENCHMARK, objective, solver, meta={},
+            stopping_criterion=stopping_criterion, force=True
+        )
+        curves.append(pd.DataFrame(curve))
+
+    # The warm started solver computes the same curve, performing only the
+    # iterations missing from the previous point at each call.
+    curve, curve_warm = curves
+    stop_vals = curve_warm['stop_val']
+    assert list(stop_vals) == list(curve['stop_val'])
+    assert solver.n_iters == list(np.diff(stop_vals, prepend=0))
+    np.testing.assert_allclose(
+        curve_warm['objective_value'], curve['objective_value']
+    )
+    assert curve_warm['time'].is_monotonic_increasing
+
+
+@pytest.mark.parametrize('eval_mode', ['sync', 'deferred', 'thread'])
+def test_callback_eval_mode(eval_mode):
+    import numpy as np
+    from benchopt.runner import _Callback
+    from benchopt.stopping_criterion import StoppingCriterion
+
+    objective = get_test_objective()
+    dimension, _ = objective._dataset._get_data()
+
+    solver = [s for s in DUMMY_BENCHMARK.get_solvers()
+              if s.name == 'Python-PGD-with-cb'][0].get_instance()
+    stopping_criterion = StoppingCriterion('callback').get_runner_instance(
+        max_runs=10, timeout=None, solver=solver
+    )
+    callback = _Callback(
+        objective, {}, stopping_criterion, eval_mode=eval_mode,
+        buffer_size=3
+    )
+
+    # Update the iterate inplace, as solvers can do. The objective values
+    # must be the ones of the iterates when they were passed to the callback.
+    x = np.zeros(dimension)
+    while callback(x):
+        x += 1
+    curve, status = callback.get_results()
+
+    assert status == 'max_runs'
+    assert len(curve) == 11
+    for cost in curve:
+        expected = objective(np.full(dimension, cost['stop_val'], float))
+        assert cost['objective_value'] == pytest.approx(
+            expected['objective_value']
+        )
+    assert x[0] == curve[-1]['stop_val']
+
+
+@pytest.mark.parametrize('eval_mode, eval_time', [
+    ('sync', 0.01), ('deferred', 0.01), ('thread', 0.1)
+])
+def test_callback_timeout(eval_mode, eval_time):
+    import time
+    import numpy as np
+    from benchopt.runner import _Callback
+    from benchopt.stopping_criterion import StoppingCriterion
+
+    objective = get_test_objective()
+    dimension, _ = objective._dataset._get_data()
+
+    def compute(beta, compute=objective.compute):
+        time.sleep(eval_time)
+        return compute(beta)
+    objective.compute = compute
+
+    solver = [s for s in DUMMY_BENCHMARK.get_solvers()
+              if s.name == 'Python-PGD-with-cb'][0].get_instance()
+    stopping_criterion = StoppingCriterion('callback').get_runner_instance(
+        max_runs=100, timeout=0.3, solver=solver
+    )
+    callback = _Callback(objective, {}, stopping_criterion,
+                         eval_mode=eval_mode, buffer_size=32)
+
+    # The iterates reached before the timeout are kept, even when they are
+    # evaluated after it.
+    x = np.zeros(dimension)
+    while callback(x):
+        time.sleep(0.01)
+    curve, status = callback.get_results()
+
+    assert status == 'timeout'
+    assert len(curve) >= 5
+    assert curve[-1]['time'] >= 0.3
+
+
+def test_callback_thread_error():
+    import numpy as np
+    from benchopt.runner import _Callback
+
+    def objective(x):
+        raise ValueError("failed evaluation")
+
+    solver = TEST_SOLVER.get_instance()
+    stopping_criterion = solver.stopping_criterion.get_runner_instance(
+        max_runs=10, timeout=None, solver=solver
+    )
+    callback = _Callback(
+        objective, {}, stopping_criterion, eval_mode='thread'
+    )
+
+    # Errors in the worker thread are raised in the solver thread
+    with pytest.raises(ValueError, match="failed evaluation"):
+        while callback(np.zeros(2)):
+            pass
+
+
+def test_time_sampling():
+    from benchopt.stopping_criterion import SufficientProgressCriterion
+
+    solver = [s for s in DUMMY_BENCHMARK.get_solvers()
+              if s.name == 'Python-PGD'][0].get_instance()
+    criterion = SufficientProgressCriterion(strategy='iteration')
+    stopping_criterion = criterion.get_runner_instance(
+        max_runs=4, timeout=8, solver=solver, sampling='time'
+    )
+    assert stopping_criterion.sampling == 'time'
+
+    # With 1s for 10 iterations, the 3 remaining points are at 2s, 4s and 8s
+    # so the next point needs 20 iterations.
+    curve = [dict(stop_val=0, time=0), dict(stop_val=10, time=1.)]
+    assert stopping_criterion.get_next_time_stop_val(10, curve) == 20
+    curve.append(dict(stop_val=20, time=2.))
+    assert stopping_criterion.get_next_time_stop_val(20, curve) == 40
+
+    # The stop_val always increases
+    assert stopping_criterion.get_next_time_stop_val(0, curve[:1]) == 1
+    curve.append(dict(stop_val=40, time=8.))
+    assert stopping_criterion.get_next_time_stop_val(40, curve) == 41
+
+    # Fall back to the geometric sampling without timeout or when the solver
+    # defines its own get_next.
+    assert criterion.get_runner_instance(
+        max_runs=4, timeout=None, solver=solver, sampling='time'
+    ).sampling == 'geometric'
+    assert criterion.get_runner_instance(
+        max_runs=4, timeout=8, solver=TEST_SOLVER.get_instance(),
+        sampling='time'
+    ).sampling == 'geometric'
+
+
+def test_budget_scheduler(monkeypatch):
+    from benchopt import runner
+
+    now = [0.]
+    monkeypatch.setattr(runner.time, 'time', lambda: now[0])
+    scheduler = runner.BudgetScheduler(total_timeout=90, n_units=3)
+
+    # The time left is shared between the remaining units, so the time not
+    # used by the first unit is given to the next ones.
+    assert scheduler.allocate() == 30
+    now[0] = 10
+    assert scheduler.allocate() == 40
+    now[0] = 80
+    assert scheduler.allocate() == 10
+    now[0] = 100
+    assert scheduler.allocate() == 0
+
+    # Concurrent units started together get the same share. The time still
+    # allocated to the running units is not shared, and a unit cannot run
+    # after the deadline.
+    now[0] = 0
+    scheduler = runner.BudgetScheduler(total_timeout=90, n_units=4,
+                                       n_workers=2)
+    assert scheduler.allocate(slot=0) == 45
+    assert scheduler.allocate(slot=1) == 45
+    now[0] = 10
+    assert scheduler.allocate(slot=0) == 62.5
+    now[0] = 45
+    assert scheduler.allocate(slot=1) == 45
+
+
+class _SleepExecutor(ThreadPoolExecutor):
+    # Run each unit as a sleep of meta['duration'], recording its start and
+    # end times, instead of running the solver.
+    def __init__(self, max_workers):
+        super().__init__(max_workers=max_workers)
+        self.times = {}
+
+    def _sleep(self, meta, solver_name):
+        start = time.perf_counter()
+        time.sleep(meta['duration'])
+        self.times[solver_name] = start, time.perf_counter()
+        return solver_name, '', {}
+
+    def submit(self, fn, meta, solver_name, **kwargs):
+        return super().submit(self._sleep, meta, solver_name)
+
+
+def test_parallel_slots_freed_on_completion():
+    from benchopt.runner import _run_solvers_in_parallel
+
+    durations = dict(a=.5, b=.05, c=.05, d=.05)
+    all_runs = [
+        dict(solver_name=name, meta=dict(
+            data_name='data', objective_name='obj', duration=duration
+        ))
+        for name, duration in durations.items()
+    ]
+    with _SleepExecutor(max_workers=2) as executor:
+        curves = list(_run_solvers_in_parallel(
+            all_runs, executor, n_workers=2
+        ))
+
+    # The slot of the short units is reused while the first unit runs, but
+    # the curves are still yielded in the order of all_runs.
+    assert [curve for curve, _ in curves] == list(durations)
+    assert executor.times['d'][0] < executor.times['a'][1]
+
+
+def test_total_timeout():
+    df, out = run_dummy_benchmark(max_runs=5, total_timeout=0)
+
+    out.check_output(r'Python-PGD\[step_size=1\]:.*done \(budget exhausted\)',
+                     repetition=1)
+    assert df['budget_truncated'].all()
+
+
+def test_n_threads():
+    df, _ = run_dummy_benchmark(n_threads=1, pin_cpus=True)
+
+    assert (df['n_threads_blas'] == 1).all()
+    assert (df['n_cpus'] >= 1).all()
+
+
+def test_scaling_threads():
+    import matplotlib.pyplot as plt
+    from benchopt.plotting import plot_scaling_curve
+
+    df, out = run_dummy_benchmark(max_runs=2, scaling_threads=[1, 2])
+
+    out.check_output(r'Python-PGD\[step_size=1\] \(threads=2\):.*done')
+    assert df.groupby('solver_name')['n_threads'].unique().to_dict() == {
+        'Python-PGD[step_size=1] (threads=1)': [1],
+        'Python-PGD[step_size=1] (threads=2)': [2],
+    }
+    for plotly in [False, True]:
+        plot_scaling_curve(df, plotly=plotly)
+    plt.close('all')
+
+    with pytest.raises(ValueError, match="n_threads and scaling_threads"):
+        run_benchmark(DUMMY_BENCHMARK, n_threads=1, scaling_threads=[1, 2])
+
+
+def test_timing_trials():
+    df, _ = run_dummy_benchmark(max_runs=2, n_warmup=1, n_trials=3)
+
+    assert (df['time_min'] <= df['time']).all()
+    assert (df['time_mad'] >= 0).all()
+    assert df['n_time_outliers'].between(0, 3).all()
+
+    with pytest.raises(ValueError, match="n_trials positive"):
+        run_benchmark(DUMMY_BENCHMARK, n_trials=0)
+
+
+def test_solver_warmup():
+    import time
+    from benchopt.runner import run_one_to_cvg
+
+    objective = get_test_objective()
+
+    class WarmupSolver(TEST_SOLVER):
+        def warmup(self):
+            # Simulate a JIT compilation, which should not be timed.
+            time.sleep(.2)
+            self.warmed_up = True
+
+        def run(self, n_iter):
+            assert self.warmed_up
+            super().run(n_iter)
+
+    solver = WarmupSolver.get_instance()
+    solver._set_objective(objective)
+    stopping_criterion = solver.stopping_criterion.get_runner_instance(
+        max_runs=2, timeout=None, solver=solver
+    )
+    curve, _ = run_one_to_cvg(
+        DUMMY_BENCHMARK, objective, solver, meta={},
+        stopping_criterion=stopping_criterion, force=True
+    )
+    curve = pd.DataFrame(curve)
+    assert (curve['compile_time'] >= .2).all()
+    assert (curve['time'] < .2).all()
+
+
+def test_timing_breakdown():
+    df, _ = run_dummy_benchmark(
+        solver_names=['python-pgd-with-cb'], forced_solvers=[SELECT_ONE_PGD],
+        max_runs=2
+    )
+
+    for col in ['time_set_objective', 'time_objective_eval']:
+        assert (df[col] >= 0).all()
+    # get_result is not called for the solvers with the callback strategy.
+    is_cb = df['solver_name'].str.contains('cb')
+    assert is_cb.any()
+    assert (df.loc[~is_cb, 'time_get_result'] >= 0).all()
+    assert df.loc[is_cb, 'time_get_result'].isna().all()
+
+
+def test_unit_key(tmp_path):
+    import os
+    from benchopt.runner import get_unit_key
+    from benchopt.utils.dynamic_modules import get_file_hash
+
+    # The hash of a file is updated when the file changes.
+    module = tmp_path / 'module.py'
+    module.write_text('a = 1')
+    file_hash = get_file_hash(module)
+    assert get_file_hash(module) == file_hash
+    module.write_text('a = 22')
+    os.utime(module, ns=(0, 0))
+    assert get_file_hash(module) != file_hash
+
+    objective = get_test_objective()
+    key = get_unit_key(objective, TEST_SOLVER.get_instance())
+    assert key == get_unit_key(objective, TEST_SOLVER.get_instance())
+
+    objective_2 = get_test_objective(reg=.5)
+    assert key != get_unit_key(objective_2, TEST_SOLVER.get_instance())
+
+    # The parameters of the stopping criterion are part of the key.
+    solver = TEST_SOLVER.get_instance()
+
+    def get_criterion(**runner_kwargs):
+        return solver.stopping_criterion.get_runner_instance(
+            solver=solver, **runner_kwargs
+        )
+
+    key = get_unit_key(objective, solver, get_criterion(max_runs=10))
+    assert key == get_unit_key(objective, solver, get_criterion(max_runs=10))
+    assert key != get_unit_key(objective, solver, get_criterion(max_runs=5))
+    assert key != get_unit_key(
+        objective, solver, get_criterion(max_runs=10, timeout=1)
+    )
+
+
+def test_cached_resolutions_reused(tmp_path, monkeypatch):
+    from joblib import Memory
+    from benchopt.utils.cache_manager import list_cache_entries
+
+    monkeypatch.setattr(
+        DUMMY_BENCHMARK, '_mem', Memory(location=tmp_path, verbose=0),
+        raising=False
+    )
+
+    def get_resolution_entries():
+        return {
+            entry['path'] for entry in list_cache_entries(tmp_path)
+            if entry['function'] == 'run_one_resolution'
+        }
+
+    # Raising max_runs only computes the new resolutions.
+    df, _ = run_dummy_benchmark(max_runs=3)
+    entries = get_resolution_entries()
+    df_more, _ = run_dummy_benchmark(max_runs=4)
+    new_entries = get_resolution_entries() - entries
+    assert len(entries) == len(df)
+    assert len(new_entries) == len(df_more) - len(df)
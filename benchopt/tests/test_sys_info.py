@@ -0,0 +1,98 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from benchopt.tests import run_dummy_benchmark
+
+
+def test_sys_info_collected_once(monkeypatch):
+    from benchopt.utils import sys_info
+
+    n_calls = []
+    collect_sys_info = sys_info._collect_sys_info
+
+    def _collect_sys_info():
+        n_calls.append(1)
+        return collect_sys_info()
+
+    monkeypatch.setattr(sys_info, '_SYS_INFO', None)
+    monkeypatch.setattr(sys_info, '_collect_sys_info', _collect_sys_info)
+
+    info = sys_info.get_sys_info()
+    assert sys_info.get_sys_info() == info
+    assert len(n_calls) == 1
+
+    # Modifying the returned dict should not change the stored info
+    info['platform'] = None
+    assert sys_info.get_sys_info()['platform'] is not None
+
+
+def test_sys_info_in_metadata():
+    from benchopt.utils.sys_info import get_sys_info
+    from benchopt.plotting.generate_html import get_sysinfo
+
+    df, _ = run_dummy_benchmark()
+
+    # System info are not stored in each row but once in the metadata
+    info = get_sys_info()
+    assert not set(info).intersection(df.columns)
+    assert df.attrs['sys_info'] == json.loads(json.dumps(info))
+
+    # Result files with the system info in each row are still supported
+    df_legacy = df.copy()
+    df_legacy.attrs = {}
+    for key, value in info.items():
+        df_legacy[key] = [value] * len(df)
+    assert get_sysinfo(df_legacy) == get_sysinfo(df)
+    assert get_sysinfo(df)['sub']['platform'] != ''
+
+
+class _OtherMachineExecutor(ThreadPoolExecutor):
+    # Run the units with the system info of another machine.
+    def __init__(self, sys_info):
+        super().__init__(max_workers=1)
+        self.sys_info = sys_info
+
+    def _run(self, fn, **kwargs):
+        from benchopt.utils import sys_info
+
+        driver_info, sys_info._SYS_INFO = sys_info._SYS_INFO, self.sys_info
+        try:
+            return fn(**kwargs)
+        finally:
+            sys_info._SYS_INFO = driver_info
+
+    def submit(self, fn, **kwargs):
+        return super().submit(self._run, fn, **kwargs)
+
+
+def test_sys_info_by_hardware():
+    from benchopt.utils import sys_info
+
+    # Each row records the hardware of the worker which ran the solver, and
+    # the metadata store the system info of each hardware.
+    info = sys_info.get_sys_info()
+    info['system-cpus'] += 1
+    with _OtherMachineExecutor(info) as executor:
+        df, _ = run_dummy_benchmark(executor=executor)
+
+    key = sys_info.get_hardware_key(info)
+    assert key != sys_info.get_hardware_key()
+    assert (df['hardware_key'] == key).all()
+    assert df.attrs['sys_info_by_hardware'] == {
+        key: json.loads(json.dumps(info))
+    }
+
+
+def test_hardware_key(monkeypatch):
+    from benchopt.utils import sys_info
+
+    key = sys_info.get_hardware_key()
+    assert sys_info.get_hardware_key() == key
+
+    # The key only depends on the hardware, not on the software versions.
+    info = sys_info.get_sys_info()
+    info['version-numpy'] = 'other'
+    monkeypatch.setattr(sys_info, '_SYS_INFO', info)
+    assert sys_info.get_hardware_key() == key
+    info['system-cpus'] += 1
+    assert sys_info.get_hardware_key() != key
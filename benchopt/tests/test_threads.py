@@ -0,0 +1,18 @@
+import pytest
+
+
+def test_limit_threads():
+    from benchopt.utils.threads import get_cpus
+    from benchopt.utils.threads import limit_threads
+    from benchopt.utils.threads import get_cpu_blocks
+
+    cpus = get_cpus()
+    with limit_threads(n_threads=1, cpus=cpus[:1]) as thread_counts:
+        assert thread_counts['n_cpus'] == 1
+        assert thread_counts['n_threads_blas'] == 1
+    assert get_cpus() == cpus
+
+    blocks = get_cpu_blocks(len(cpus))
+    assert sorted(sum(blocks, [])) == cpus
+    with pytest.raises(ValueError, match="CPUs available"):
+        get_cpu_blocks(len(cpus) + 1)
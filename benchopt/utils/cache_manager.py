@@ -0,0 +1,168 @@
+"""Inspect and bound the size of the cache folder of a benchmark.
+
+The cache folder contains the runs of the solvers cached by joblib, with one
+folder per call, and the data of the datasets, see ``data_cache``. Each of
+these folders is an entry of the cache. The entries are evicted by last
+access time: the time joblib or ``load_data`` last read them, as recorded by
+the filesystem, or the time they were written if it is more recent.
+"""
+import re
+import ast
+import json
+import time
+import pickle
+import shutil
+from pathlib import Path
+
+from .data_cache import INDEX_FILE
+
+
+# File marking a folder as an entry of the joblib cache.
+JOBLIB_OUTPUT_FILE = 'output.pkl'
+
+# Name of the folder of the dataset cache in the cache folder.
+DATASETS_DIR = 'datasets'
+
+SIZE_UNITS = {'': 1, 'K': 1e3, 'M': 1e6, 'G': 1e9, 'T': 1e12}
+
+
+def parse_size(size):
+    """Convert a size such as ``'500MB'`` or ``'2G'`` to a number of bytes.
+
+    An int or a string without unit is a number of bytes.
+    """
+    if isinstance(size, (int, float)):
+        return int(size)
+    match = re.fullmatch(
+        r'\s*(\d+(?:\.\d*)?)\s*([KMGT]?)(?:i?B)?\s*', size, re.IGNORECASE
+    )
+    if match is None:
+        raise ValueError(
+            f"Could not parse the size '{size}'. It should be a number of "
+            "bytes, optionally followed by a unit in K, M, G or T, as '10GB'."
+        )
+    value, unit = match.groups()
+    return int(float(value) * SIZE_UNITS[unit.upper()])
+
+
+def format_size(n_bytes):
+    "Format a number of bytes in a human readable way."
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if n_bytes < 1000:
+            return f"{n_bytes:.1f}{unit}" if unit != 'B' else f"{n_bytes}B"
+        n_bytes /= 1000
+    return f"{n_bytes:.1f}TB"
+
+
+def _get_folder_size(folder):
+    return sum(f.stat().st_size for f in folder.rglob('*') if f.is_file())
+
+
+def _get_last_access(filename):
+    stat = filename.stat()
+    return max(stat.st_atime, stat.st_mtime)
+
+
+def _describe_run_entry(folder):
+    "Return the function, solver and dataset of a joblib cache entry."
+    # The objective and the solver are not stored in the input arguments, as
+    # they are ignored by the cache. Their names are read from the ``meta``
+    # argument, stored as its repr.
+    try:
+        with open(folder / 'metadata.json') as f:
+            meta = ast.literal_eval(json.load(f)['input_args']['meta'])
+    except (OSError, ValueError, KeyError, SyntaxError):
+        meta = {}
+    return dict(
+        kind='run', function=folder.parent.name,
+        solver=meta.get('solver_name'), dataset=meta.get('data_name'),
+    )
+
+
+def _describe_dataset_entry(folder):
+    "Return the name of the dataset cached in folder."
+    try:
+        with open(folder / INDEX_FILE, 'rb') as f:
+            name = pickle.load(f).get('name')
+    except (OSError, pickle.UnpicklingError, EOFError):
+        name = None
+    return dict(kind='dataset', function=None, solver=None, dataset=name)
+
+
+def list_cache_entries(cache_dir):
+    """List the entries of a benchmark's cache.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Cache folder of the benchmark, see ``Benchmark.get_cache_location``.
+
+    Returns
+    -------
+    entries : list of dict
+        The entries, from the least to the most recently used. Each one has
+        its ``path``, ``size`` in bytes, ``last_access`` timestamp and
+        ``kind``, 'run' or 'dataset'. The ``solver`` and ``dataset`` names
+        are None when not known, and ``function`` is the function cached
+        for the runs.
+    """
+    cache_dir = Path(cache_dir)
+    if not cache_dir.exists():
+        return []
+
+    entries = []
+    for marker in cache_dir.rglob(JOBLIB_OUTPUT_FILE):
+        entries.append(dict(
+            path=marker.parent, **_describe_run_entry(marker.parent)
+        ))
+        entries[-1]['last_access'] = _get_last_access(marker)
+    for marker in (cache_dir / DATASETS_DIR).glob(f'*/{INDEX_FILE}'):
+        entries.append(dict(
+            path=marker.parent, **_describe_dataset_entry(marker.parent)
+        ))
+        entries[-1]['last_access'] = _get_last_access(marker)
+
+    for entry in entries:
+        entry['size'] = _get_folder_size(entry['path'])
+    return sorted(entries, key=lambda entry: entry['last_access'])
+
+
+def prune_cache(cache_dir, max_size=None, max_age=None):
+    """Remove the least recently used entries of a benchmark's cache.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Cache folder of the benchmark.
+    max_size : int | str | None
+        The least recently used entries are removed until the cache is
+        smaller than this size, in bytes or as accepted by ``parse_size``.
+        If None, the size is not bounded.
+    max_age : float | None
+        If not None, the entries not used for more than ``max_age`` days are
+        removed.
+
+    Returns
+    -------
+    removed : list of dict
+        The removed entries, as returned by ``list_cache_entries``.
+    """
+    entries = list_cache_entries(cache_dir)
+    total_size = sum(entry['size'] for entry in entries)
+    max_size = None if max_size is None else parse_size(max_size)
+    oldest_access = None
+    if max_age is not None:
+        oldest_access = time.time() - max_age * 24 * 3600
+
+    removed = []
+    for entry in entries:
+        too_big = max_size is not None and total_size > max_size
+        too_old = (
+            oldest_access is not None and entry['last_access'] < oldest_access
+        )
+        if not (too_big or too_old):
+            continue
+        shutil.rmtree(entry['path'], ignore_errors=True)
+        total_size -= entry['size']
+        removed.append(entry)
+    return removed
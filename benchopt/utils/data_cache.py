@@ -0,0 +1,156 @@
+"""Cache the data of the datasets on disk, to load them once for all runs.
+
+The data returned by ``Dataset.get_data`` are stored in one folder per
+dataset, named after a key computed from the hash of the dataset module and
+the parameters of the dataset. The numpy arrays are stored as ``.npy`` files
+and the scipy sparse matrices in CSR or CSC format as the ``.npy`` files of
+their components. They are loaded memory-mapped, so only the parts used are
+read from the disk and the pages are shared between the processes loading
+the same dataset. The other values are pickled.
+"""
+import os
+import pickle
+import shutil
+import hashlib
+from pathlib import Path
+
+from .dynamic_modules import get_file_hash
+
+
+# Name of the file describing the content of a cached dataset.
+INDEX_FILE = 'index.pkl'
+
+# Components of the sparse matrices stored as arrays, by format.
+SPARSE_COMPONENTS = ('data', 'indices', 'indptr')
+
+
+def get_data_key(dataset):
+    """Return the key identifying the data of a dataset in the cache.
+
+    The key changes when the module defining the dataset or its parameters
+    change. Changes in the modules imported by the dataset module are not
+    detected.
+    """
+    hasher = hashlib.md5()
+    hasher.update(get_file_hash(dataset._module_filename).encode())
+    hasher.update(repr(sorted(dataset._parameters.items())).encode())
+    return hasher.hexdigest()
+
+
+def _dump_value(value, filename):
+    """Store value in files starting with filename and describe how.
+
+    Returns the description of the stored value, used by ``_load_value``.
+    """
+    import numpy as np
+    from scipy import sparse
+
+    if isinstance(value, np.ndarray) and not value.dtype.hasobject:
+        np.save(f"{filename}.npy", value, allow_pickle=False)
+        return 'array', None
+    if sparse.issparse(value) and value.format in ('csr', 'csc'):
+        for comp in SPARSE_COMPONENTS:
+            np.save(f"{filename}.{comp}.npy", getattr(value, comp),
+                    allow_pickle=False)
+        return 'sparse', (value.format, value.shape)
+    return 'pickle', value
+
+
+def _load_value(kind, info, filename):
+    "Load a value stored with ``_dump_value``, memory-mapping the arrays."
+    import numpy as np
+    from scipy import sparse
+
+    # Use copy-on-write mappings, so inplace changes of the data in a run
+    # are neither written to the cache nor seen by the other processes.
+    if kind == 'array':
+        return np.load(f"{filename}.npy", mmap_mode='c')
+    if kind == 'sparse':
+        fmt, shape = info
+        components = tuple(
+            np.load(f"{filename}.{comp}.npy", mmap_mode='c')
+            for comp in SPARSE_COMPONENTS
+        )
+        matrix_class = sparse.csr_matrix if fmt == 'csr' else sparse.csc_matrix
+        return matrix_class(components, shape=shape, copy=False)
+    return info
+
+
+def save_data(cache_dir, key, dimension, data, name=None):
+    """Store the data of a dataset in the cache.
+
+    The data are written in a temporary folder, which is then renamed, so a
+    cached dataset is never seen partially written. Nothing is stored if the
+    data cannot be pickled.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Folder containing the cached datasets.
+    key : str
+        Key of the dataset, see ``get_data_key``.
+    dimension : tuple
+        Dimension returned by ``Dataset._get_data``.
+    data : dict
+        Data returned by ``Dataset._get_data``.
+    name : str | None
+        Name of the dataset, displayed by ``benchopt cache``.
+
+    Returns
+    -------
+    saved : bool
+        Whether the data were stored.
+    """
+    cache_dir = Path(cache_dir)
+    data_dir = cache_dir / key
+    tmp_dir = cache_dir / f"{key}.tmp-{os.getpid()}"
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        index = {}
+        for i, (data_name, value) in enumerate(data.items()):
+            index[data_name] = _dump_value(value, tmp_dir / str(i))
+        with open(tmp_dir / INDEX_FILE, 'wb') as f:
+            pickle.dump(
+                dict(name=name, dimension=dimension, index=index), f
+            )
+        tmp_dir.rename(data_dir)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    except OSError:
+        # Another process stored the same dataset first.
+        return data_dir.exists()
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return True
+
+
+def load_data(cache_dir, key):
+    """Load the data of a dataset from the cache.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Folder containing the cached datasets.
+    key : str
+        Key of the dataset, see ``get_data_key``.
+
+    Returns
+    -------
+    dimension, data : tuple | None
+        The data as returned by ``Dataset._get_data``, or None if they are
+        not in the cache.
+    """
+    data_dir = Path(cache_dir) / key
+    try:
+        with open(data_dir / INDEX_FILE, 'rb') as f:
+            content = pickle.load(f)
+        # Record the access, used to evict the least recently used entries.
+        os.utime(data_dir / INDEX_FILE)
+    except FileNotFoundError:
+        return None
+
+    data = {
+        name: _load_value(kind, info, data_dir / str(i))
+        for i, (name, (kind, info)) in enumerate(content['index'].items())
+    }
+    return content['dimension'], data
@@ -1,5 +1,6 @@
 """Utilities to load classes and module from filenames and class names.
 """
+import os
 import sys
 import hashlib
 import importlib
@@ -64,16 +65,34 @@ def _load_class_from_module(module_filename, class_name, benchmark_dir):
     return klass
 
 
+# MD5 hashes of the files, with the modification time and size of the file
+# when it was computed.
+_FILE_HASHES = {}
+
+
 def get_file_hash(filename):
     """Compute the MD5 hash of a file.
+
+    The hash is computed once and recomputed only if the modification time
+    or the size of the file changed, as it is needed each time a solver, an
+    objective or a dataset is pickled.
     """
+    stat = os.stat(filename)
+    key = str(filename)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    cached = _FILE_HASHES.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
     hasher = hashlib.md5()
     with open(filename, 'rb') as f:
         hasher.update(f.read())
-    return hasher.hexdigest()
+    _FILE_HASHES[key] = signature, hasher.hexdigest()
+    return _FILE_HASHES[key][1]
 
 
-def _reconstruct_class(module_filename, class_name, pickled_module_hash=None):
+def _reconstruct_class(module_filename, class_name, benchmark_dir,
+                       pickled_module_hash=None):
     """Retrieve a class in module defined by its filename.
 
     Parameters
@@ -82,6 +101,9 @@ def _reconstruct_class(module_filename, class_name, pickled_module_hash=None):
         path to the module from which the class should be retrieved.
     class_name : str
         Name of the class to retrieve.
+    benchmark_dir : str or Path
+        Path to the benchmark_dir. It is used to set the package name of the
+        module and to allow ``import_from`` in the benchmark's modules.
     pickled_module_has : str or None
         MD5 hash of the module file, to ensure the module did not changed.
 
@@ -97,4 +119,11 @@ def _reconstruct_class(module_filename, class_name, pickled_module_hash=None):
             'object should not be stored using pickle for long term storage.'
         )
 
-    return _load_class_from_module(module_filename, class_name)
+    # Make sure the benchmark is set, as this function can be called in a
+    # new process where the benchmark was not loaded yet.
+    from .safe_import import set_benchmark
+    set_benchmark(benchmark_dir)
+
+    return _load_class_from_module(
+        module_filename, class_name, Path(benchmark_dir)
+    )
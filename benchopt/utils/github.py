@@ -10,7 +10,7 @@ def get_file_content(repo, branch, git_path):
     "Get content and sha of the file if it exists else return None."
     try:
         prev_content = repo.get_contents(git_path, ref=branch)
-        return prev_content.decoded_content.decode('utf-8'), prev_content.sha
+        return prev_content.decoded_content, prev_content.sha
     except GithubException:
         return None, None
 
@@ -24,8 +24,8 @@ def publish_result_file(benchmark_name, file_path, token):
         raise FileNotFoundError(
             f"Could not upload file {file_to_upload}."
         )
-    with file_to_upload.open('r') as f:
-        file_content = f.read()
+    # Read the file as bytes to support binary result formats.
+    file_content = file_to_upload.read_bytes()
 
     git_path = f"benchmarks/{benchmark_name}/outputs/{file_to_upload.name}"
     file_name = f'{benchmark_name}/{file_to_upload.name}'
@@ -0,0 +1,257 @@
+"""Run parts of a benchmark in a child process that can be killed.
+
+A solver stuck in one call to ``run`` cannot be interrupted from the same
+process. With ``WorkerProcess``, the calls are made in a child process, which
+is killed if they do not return before a deadline.
+
+Running the solvers in child processes also isolates them from each other:
+thread pools, JIT caches or memory leaks of a solver do not affect the ones
+run after it. ``get_worker`` keeps one long-lived worker per key, e.g. per
+solver class, to avoid starting a process and sending the data for each run.
+"""
+import os
+import time
+import atexit
+import signal
+import multiprocessing
+
+from ..config import DEBUG
+
+
+# Time in seconds a call is allowed to run after the deadline before the
+# worker is killed. It lets the resolution started just before the deadline
+# end, as in the main process.
+GRACE_TIME = 1.
+
+# Connection to the main process, set in the worker processes.
+_PARENT_CONN = None
+
+# Long-lived workers started with get_worker, by key.
+_WORKERS = {}
+
+
+def report(value):
+    """Send a partial result to the main process.
+
+    The reported values are kept by the ``WorkerProcess`` if the call is
+    killed. Outside of a worker, this does nothing.
+    """
+    if _PARENT_CONN is not None:
+        _PARENT_CONN.send(('report', value))
+
+
+def _worker_main(conn, state):
+    """Serve the calls sent by the main process until it sends None.
+
+    The messages are ``(func, kwargs)`` to call ``func(**state, **kwargs)``,
+    or ``(None, state)`` to replace the state. Each one gets a reply.
+    """
+    global _PARENT_CONN
+    _PARENT_CONN = conn
+
+    # Run in a new process group, so the processes started by the solver,
+    # such as for CommandLineSolver, are killed with the worker.
+    if hasattr(os, 'setpgrp'):
+        os.setpgrp()
+
+    while True:
+        try:
+            msg = conn.recv()
+        except EOFError:
+            return
+        except Exception as e:
+            # The message could not be unpickled, e.g. if a module is missing.
+            conn.send(('error', e))
+            continue
+        if msg is None:
+            return
+        func, kwargs = msg
+        try:
+            if func is None:
+                state, result = kwargs, ('result', None)
+            else:
+                result = ('result', func(**state, **kwargs))
+        except BaseException as e:
+            if DEBUG:
+                import traceback
+                traceback.print_exc()
+            result = ('error', e)
+        try:
+            conn.send(result)
+        except Exception as e:
+            # The result or the exception cannot be pickled.
+            conn.send(('error', RuntimeError(
+                f"Could not send the result from the worker process: {e}"
+            )))
+
+
+class WorkerProcess:
+    """Child process making calls that can be interrupted at a deadline.
+
+    The process is started with the ``spawn`` method, so the objects of
+    ``state`` are pickled once and rebuilt in the worker, where they are kept
+    for all the calls. Use it as a context manager to make sure the process
+    is stopped.
+
+    Parameters
+    ----------
+    **state : dict
+        Objects passed as keyword arguments to all the functions called in
+        the worker, for instance the ``objective`` and the ``solver``.
+
+    Attributes
+    ----------
+    reports : list
+        The values sent with ``report`` during the last call.
+    """
+
+    def __init__(self, **state):
+        ctx = multiprocessing.get_context('spawn')
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(
+            target=_worker_main, args=(child_conn, state), daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self.reports = []
+        # Keep the objects of the state, so they cannot be freed and their
+        # id reused by new objects, which would then not be sent.
+        self._state = dict(state)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def is_alive(self):
+        "Return True if the worker can still be used."
+        return not self._conn.closed and self._process.is_alive()
+
+    def set_state(self, **state):
+        """Replace the objects passed to the functions called in the worker.
+
+        The objects are only sent if they are not the same as the current
+        ones, so calling this for each run does not pickle them again.
+        """
+        same_state = state.keys() == self._state.keys() and all(
+            obj is self._state[k] for k, obj in state.items()
+        )
+        if not same_state:
+            self._conn.send((None, state))
+            self._wait_result('set_state')
+            self._state = dict(state)
+
+    def call(self, func, deadline=None, **kwargs):
+        """Call ``func(**state, **kwargs)`` in the worker.
+
+        Parameters
+        ----------
+        func : callable
+            Function to call. It must be picklable, i.e. defined at the top
+            level of a module.
+        deadline : float | None
+            Time, as given by ``time.time``, after which the call is
+            interrupted. The worker is then killed. If None, wait for the
+            call to end.
+        **kwargs : dict
+            Other arguments of ``func``.
+
+        Returns
+        -------
+        result : object
+            The value returned by ``func``.
+
+        Raises
+        ------
+        TimeoutError
+            If the call did not end before the deadline. The values reported
+            before are kept in ``reports``.
+        """
+        self.reports = []
+        self._conn.send((func, kwargs))
+        return self._wait_result(func.__name__, deadline=deadline)
+
+    def _wait_result(self, name, deadline=None):
+        "Wait for the result of the call to name, collecting the reports."
+        while True:
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline + GRACE_TIME - time.time(), 0)
+            if not self._conn.poll(timeout):
+                self.kill()
+                raise TimeoutError(f"{name} did not end before the deadline.")
+            try:
+                kind, value = self._conn.recv()
+            except EOFError:
+                self.kill()
+                raise RuntimeError(
+                    f"The worker process died while running {name} "
+                    f"with exit code {self._process.exitcode}."
+                )
+            if kind == 'report':
+                self.reports.append(value)
+            elif kind == 'error':
+                raise value
+            else:
+                return value
+
+    def kill(self):
+        "Kill the worker and the processes it started."
+        if self._process.is_alive():
+            if hasattr(os, 'killpg'):
+                try:
+                    os.killpg(self._process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+            self._process.kill()
+        self._process.join()
+        self._conn.close()
+
+    def close(self):
+        "Stop the worker once its current call is done."
+        if self._conn.closed:
+            return
+        if self._process.is_alive():
+            try:
+                self._conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+            self._process.join(timeout=GRACE_TIME)
+        self.kill()
+
+
+def get_worker(key, **state):
+    """Get the long-lived worker process associated to key.
+
+    A new worker is started if there is none for ``key`` or if it was killed.
+    Its state is then set to ``state``, see ``WorkerProcess.set_state``. The
+    workers are stopped with ``close_workers``, or when the program exits.
+
+    Parameters
+    ----------
+    key : hashable
+        Identifier of the worker, for instance the class of a solver.
+    **state : dict
+        Objects passed as keyword arguments to all the functions called in
+        the worker.
+
+    Returns
+    -------
+    worker : WorkerProcess
+        The worker associated to ``key``.
+    """
+    worker = _WORKERS.get(key)
+    if worker is None or not worker.is_alive():
+        worker = _WORKERS[key] = WorkerProcess(**state)
+    else:
+        worker.set_state(**state)
+    return worker
+
+
+@atexit.register
+def close_workers():
+    "Stop all the workers started with get_worker."
+    for worker in _WORKERS.values():
+        worker.close()
+    _WORKERS.clear()
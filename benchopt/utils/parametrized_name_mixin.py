@@ -59,7 +59,7 @@ class ParametrizedNameMixin():
     def _reload_class(cls, pickled_module_hash=None):
 
         return _reconstruct_class(
-            cls._module_filename, cls._base_class_name,
+            cls._module_filename, cls._base_class_name, cls._benchmark_dir,
             pickled_module_hash=pickled_module_hash
         )
 
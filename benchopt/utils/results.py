@@ -0,0 +1,299 @@
+"""Helpers to save and load the result files of a benchmark run.
+
+The results of a run are stored as a table with one row per point of the
+convergence curves, in one of the ``OUTPUT_FORMATS``. The info common to the
+whole run, such as the system info, are stored once in a JSON metadata file
+next to the result file.
+"""
+import os
+import json
+from pathlib import Path
+
+from ..constants import OUTPUT_FORMATS
+from .sys_info import get_hardware_key
+
+
+def check_output_format(output_format):
+    """Check that the results can be saved with ``output_format``.
+
+    The columnar formats ``parquet`` and ``feather`` require ``pyarrow``.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unknown output format '{output_format}'. Should be one of "
+            f"{OUTPUT_FORMATS}."
+        )
+    if output_format != 'csv':
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                f"Saving the results in {output_format} format requires "
+                "pyarrow. It can be installed with `pip install pyarrow`."
+            )
+
+
+def get_output_format(result_file):
+    "Return the format of a result file, based on its suffix."
+    output_format = Path(result_file).suffix[1:]
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Could not detect the format of result file {result_file}. Its "
+            f"extension should be one of {OUTPUT_FORMATS}."
+        )
+    return output_format
+
+
+def list_result_files(output_folder, pattern='*'):
+    "List the result files in output_folder matching pattern, in any format."
+    return [
+        f for output_format in OUTPUT_FORMATS
+        for f in Path(output_folder).glob(f"{pattern}.{output_format}")
+    ]
+
+
+def get_metadata_file(result_file):
+    "Return the path of the metadata file associated to a result file."
+    return Path(result_file).with_suffix('.json')
+
+
+def get_latest_results_file(result_file):
+    """Return the file holding the latest results of a run.
+
+    The curves of the columnar formats are streamed to a CSV file, which is
+    converted at the end of the run, see ``ResultWriter``. If the run was
+    killed before the conversion, this CSV file holds all the results.
+    """
+    result_file = Path(result_file)
+    stream_file = result_file.with_suffix('.csv')
+    if result_file.suffix != '.csv' and stream_file.exists():
+        return stream_file
+    return result_file
+
+
+def save_results(df, result_file, metadata):
+    """Save the results of a run and its metadata.
+
+    Parameters
+    ----------
+    df : instance of pandas.DataFrame
+        The results of the run, with one row per point of the curves.
+    result_file : Path
+        File in which the results are saved. Its suffix gives the format.
+    metadata : dict
+        Info common to the whole run, such as ``sys_info``. It is saved in the
+        JSON file given by ``get_metadata_file(result_file)``.
+    """
+    output_format = get_output_format(result_file)
+    if output_format == 'csv':
+        df.to_csv(result_file)
+    elif output_format == 'parquet':
+        df.to_parquet(result_file)
+    else:
+        df.reset_index(drop=True).to_feather(result_file)
+    get_metadata_file(result_file).write_text(json.dumps(metadata, indent=2))
+
+
+def load_results(result_file, columns=None):
+    """Load the results of a run with its metadata.
+
+    Parameters
+    ----------
+    result_file : str or Path
+        File in which the results were saved. Its format is detected from
+        its suffix.
+    columns : list of str | None
+        If not None, only load these columns.
+
+    Returns
+    -------
+    df : instance of pandas.DataFrame
+        The results of the run. If a metadata file is associated to the
+        result file, its content is stored in ``df.attrs``. Result files
+        produced by older versions of benchopt have no metadata file and
+        store the system info in their columns.
+    """
+    import pandas as pd
+
+    output_format = get_output_format(result_file)
+    if output_format == 'csv':
+        df = pd.read_csv(result_file, usecols=columns)
+    elif output_format == 'parquet':
+        df = pd.read_parquet(result_file, columns=columns)
+    else:
+        df = pd.read_feather(result_file, columns=columns)
+
+    metadata_file = get_metadata_file(result_file)
+    if metadata_file.exists():
+        df.attrs.update(json.loads(metadata_file.read_text()))
+    return df
+
+
+def get_completed_runs(result_file):
+    """List the repetitions already run in a result file.
+
+    Parameters
+    ----------
+    result_file : str or Path
+        File in which the results were saved. If the run was killed before
+        they were converted to the format of this file, they are read from
+        the CSV file they were streamed to.
+
+    Returns
+    -------
+    completed : dict
+        Set of the ``idx_rep`` in the results, for each (data_name,
+        objective_name, solver_name).
+    """
+    keys = ['data_name', 'objective_name', 'solver_name']
+    df = load_results(
+        get_latest_results_file(result_file), columns=keys + ['idx_rep']
+    )
+    return {
+        key: set(df_key['idx_rep'])
+        for key, df_key in df.groupby(keys)
+    }
+
+
+class ResultWriter:
+    """Append the curves of a run to its result file as they are computed.
+
+    The curves are appended as CSV chunks, flushed to the disk after each
+    curve. The partial results are thus kept if the run crashes and can be
+    plotted while the run is going on. The memory used does not grow with the
+    number of curves.
+
+    The columnar formats cannot be read before the file is closed, as their
+    footer is written last. For these formats, the curves are streamed to a
+    CSV file with the same name, which is converted when the writer is closed
+    at the end of the run, or when the run fails. If the process is killed
+    before, the CSV file is left and is used to resume the run.
+
+    Parameters
+    ----------
+    result_file : Path
+        File in which the results are saved. Its suffix gives the format.
+    metadata : dict
+        Info common to the whole run, saved with ``save_results``.
+    resume : bool
+        If True, append the curves to the existing ``result_file``, keeping
+        its metadata.
+    """
+
+    def __init__(self, result_file, metadata, resume=False):
+        self.result_file = Path(result_file)
+        self.output_format = get_output_format(result_file)
+        self.stream_file = self.result_file.with_suffix('.csv')
+        self.metadata = metadata
+        self.columns = None
+        self.n_rows = 0
+        if resume:
+            self._resume()
+
+    def _resume(self):
+        "Set up the writer to append to the existing result file."
+        import pandas as pd
+
+        metadata_file = get_metadata_file(self.result_file)
+        if metadata_file.exists():
+            self.metadata = json.loads(metadata_file.read_text())
+        else:
+            self._write_metadata()
+
+        if get_latest_results_file(self.result_file) != self.stream_file:
+            df = load_results(self.result_file)
+            df.to_csv(self.stream_file)
+            self.columns, self.n_rows = list(df.columns), len(df)
+        else:
+            self.columns = list(
+                pd.read_csv(self.stream_file, index_col=0, nrows=0).columns
+            )
+            self.n_rows = len(pd.read_csv(self.stream_file, usecols=[0]))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # On error, the partial results are converted too, so the run can be
+        # resumed. If they cannot be, they are kept in the stream file.
+        try:
+            self.close()
+        except Exception:
+            if exc_type is None:
+                raise
+
+    def _write_metadata(self):
+        get_metadata_file(self.result_file).write_text(
+            json.dumps(self.metadata, indent=2)
+        )
+
+    def add_sys_info(self, sys_info):
+        """Store the system info of a machine running the solvers.
+
+        The info are stored once per hardware, in the ``sys_info_by_hardware``
+        entry of the metadata, indexed by the ``hardware_key`` of the rows
+        computed on this machine.
+        """
+        by_hardware = self.metadata.setdefault('sys_info_by_hardware', {})
+        key = get_hardware_key(sys_info)
+        if key in by_hardware:
+            return
+        by_hardware[key] = sys_info
+        if self.columns is not None:
+            self._write_metadata()
+
+    def append(self, curve):
+        """Append a curve, given as a list of dict, to the result file."""
+        import pandas as pd
+
+        if len(curve) == 0:
+            return
+
+        # Number the rows as if all the curves were stored in one DataFrame.
+        df = pd.DataFrame(
+            curve, index=range(self.n_rows, self.n_rows + len(curve))
+        )
+        if self.columns is None:
+            self._write_metadata()
+            self.columns = list(df.columns)
+            header = True
+        else:
+            new_columns = [c for c in df.columns if c not in self.columns]
+            if len(new_columns) > 0:
+                self._add_columns(new_columns)
+            df = df.reindex(columns=self.columns)
+            header = False
+
+        with self.stream_file.open('a') as f:
+            f.write(df.to_csv(header=header))
+            f.flush()
+            os.fsync(f.fileno())
+        self.n_rows += len(df)
+
+    def _add_columns(self, new_columns):
+        """Rewrite the stream file with new columns, by chunks.
+
+        This happens when the objective does not return the same values for
+        all parameters. The file is replaced atomically once rewritten.
+        """
+        import pandas as pd
+
+        self.columns += new_columns
+        tmp_file = self.stream_file.with_suffix('.csv.tmp')
+        chunks = pd.read_csv(self.stream_file, index_col=0, chunksize=10000)
+        with tmp_file.open('w') as f:
+            for i, chunk in enumerate(chunks):
+                f.write(chunk.reindex(columns=self.columns).to_csv(
+                    header=(i == 0)
+                ))
+        os.replace(tmp_file, self.stream_file)
+
+    def close(self):
+        "Convert the stream file to the output format if needed."
+        import pandas as pd
+
+        if self.output_format == 'csv' or self.n_rows == 0:
+            return
+        df = pd.read_csv(self.stream_file, index_col=0)
+        save_results(df, self.result_file, self.metadata)
+        self.stream_file.unlink()
@@ -0,0 +1,158 @@
+"""Storage backends for the cache of the runs.
+
+By default, the runs are cached by joblib in the cache folder of the
+benchmark, which can be on a shared file system. With the ``run_cache``
+setting, they are stored in a bucket of an S3-compatible object store
+instead, so that several machines share the same cache. The endpoint of the
+store, e.g. a MinIO server, is set with the ``AWS_ENDPOINT_URL`` environment
+variable, as for all the ``boto3`` clients.
+"""
+import io
+import os
+
+from joblib import register_store_backend
+from joblib._store_backends import CacheItemInfo
+from joblib._store_backends import StoreBackendBase, StoreBackendMixin
+
+
+S3_SCHEME = 's3://'
+
+
+class _UploadOnClose(io.BytesIO):
+    "Buffer uploaded to the store when closed."
+
+    def __init__(self, client, bucket, key):
+        super().__init__()
+        self._client, self._bucket, self._key = client, bucket, key
+
+    def close(self):
+        if not self.closed:
+            self._client.put_object(
+                Bucket=self._bucket, Key=self._key, Body=self.getvalue()
+            )
+        super().close()
+
+
+class ObjectStoreBackend(StoreBackendBase, StoreBackendMixin):
+    """joblib store backend saving the items in an S3-compatible bucket.
+
+    The location is an URL ``s3://<bucket>/<prefix>``. The objects are
+    accessed with a ``boto3`` S3 client, or with the client given in the
+    ``client`` backend option, which only needs the methods ``get_object``,
+    ``put_object``, ``copy_object``, ``delete_object`` and
+    ``list_objects_v2``, and the ``exceptions.NoSuchKey`` error.
+    """
+
+    def configure(self, location, verbose=0, backend_options=None):
+        if backend_options is None:
+            backend_options = {}
+        if not location.startswith(S3_SCHEME):
+            raise ValueError(
+                f"The location of the run cache should be an URL "
+                f"'{S3_SCHEME}<bucket>/<prefix>'. Got '{location}'."
+            )
+        self.bucket, _, self.location = (
+            location[len(S3_SCHEME):].partition('/')
+        )
+        self.location = self.location.strip('/')
+
+        self.client = backend_options.get('client')
+        if self.client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise ImportError(
+                    "Storing the run cache in an object store requires "
+                    "boto3. It can be installed with `pip install boto3`."
+                )
+            self.client = boto3.client('s3')
+
+        # The items are read from file-like objects, so they cannot be
+        # memory-mapped.
+        self.compress = backend_options.get('compress', False)
+        self.mmap_mode = None
+        self.verbose = verbose
+
+    def _list_objects(self, prefix, max_keys=None):
+        "Iterate over the objects whose key starts with prefix."
+        kwargs = dict(Bucket=self.bucket, Prefix=prefix)
+        if max_keys is not None:
+            kwargs['MaxKeys'] = max_keys
+        while True:
+            response = self.client.list_objects_v2(**kwargs)
+            yield from response.get('Contents', [])
+            if max_keys is not None or not response.get('IsTruncated'):
+                return
+            kwargs['ContinuationToken'] = response['NextContinuationToken']
+
+    def _open_item(self, key, mode):
+        if 'w' in mode:
+            return _UploadOnClose(self.client, self.bucket, key)
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+        except self.client.exceptions.NoSuchKey:
+            # joblib expects the missing items to raise an OSError.
+            raise FileNotFoundError(f"No object '{key}' in '{self.bucket}'")
+        return io.BytesIO(response['Body'].read())
+
+    def _item_exists(self, key):
+        # An item is either an object or a "folder", i.e. a key prefix.
+        first = next(self._list_objects(key, max_keys=1), None)
+        if first is not None and first['Key'] == key:
+            return True
+        first = next(self._list_objects(f"{key}/", max_keys=1), None)
+        return first is not None
+
+    def _move_item(self, src, dst):
+        self.client.copy_object(
+            Bucket=self.bucket, Key=dst,
+            CopySource=dict(Bucket=self.bucket, Key=src)
+        )
+        self.client.delete_object(Bucket=self.bucket, Key=src)
+
+    def create_location(self, location):
+        # Folders do not need to be created in an object store.
+        pass
+
+    def clear_location(self, location):
+        keys = [obj['Key'] for obj in self._list_objects(f"{location}/")]
+        for key in [location, *keys]:
+            self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def get_items(self):
+        items = {}
+        for obj in self._list_objects(f"{self.location}/"):
+            item_path, filename = os.path.split(obj['Key'])
+            size, last_access, is_item = items.get(
+                item_path, (0, obj['LastModified'], False)
+            )
+            items[item_path] = (
+                size + obj['Size'], max(last_access, obj['LastModified']),
+                is_item or filename == 'output.pkl'
+            )
+        return [
+            CacheItemInfo(path, size, _naive_local_time(last_access))
+            for path, (size, last_access, is_item) in items.items()
+            if is_item
+        ]
+
+
+def _naive_local_time(timestamp):
+    "Convert an aware datetime to the naive local time used by joblib."
+    if timestamp.tzinfo is None:
+        return timestamp
+    return timestamp.astimezone().replace(tzinfo=None)
+
+
+def get_run_cache_backend(location):
+    """Return the joblib backend to use for the run cache at location.
+
+    The URLs starting with ``s3://`` use the ``ObjectStoreBackend`` and the
+    other locations are folders, on a local or shared file system.
+    """
+    if str(location).startswith(S3_SCHEME):
+        return 's3'
+    return 'local'
+
+
+register_store_backend('s3', ObjectStoreBackend)
@@ -1,5 +1,6 @@
 import os
 import re
+import hashlib
 import platform
 import subprocess
 from shutil import which
@@ -61,8 +62,46 @@ def _get_numpy_libs():
     return libs
 
 
+# System info is collected once per process, see get_sys_info.
+_SYS_INFO = None
+
+
 def get_sys_info():
-    "Return a dictionary with info from the current system."
+    """Return a dictionary with info from the current system.
+
+    As collecting these info is costly (it reads system files and may run
+    external commands), they are only computed on the first call and then
+    reused for the whole process.
+    """
+    global _SYS_INFO
+
+    if _SYS_INFO is None:
+        _SYS_INFO = _collect_sys_info()
+    return dict(_SYS_INFO)
+
+
+def get_hardware_key(info=None):
+    """Return a key identifying the hardware of a system.
+
+    It is computed from the architecture, the processor, the number of CPUs,
+    the RAM and the CUDA version given by ``get_sys_info``, so that the cached
+    timings are only reused on machines with the same hardware. If ``info``
+    is given, the key of the system described by these info is returned,
+    otherwise the key of the current system.
+    """
+    if info is None:
+        info = get_sys_info()
+    hardware = [
+        info[k] for k in [
+            "platform-architecture", "system-processor", "system-cpus",
+            "system-ram (GB)", "version-cuda"
+        ]
+    ]
+    return hashlib.md5(repr(hardware).encode()).hexdigest()
+
+
+def _collect_sys_info():
+    "Collect the info from the current system."
 
     # Import are nested to avoid long import time when func is not called
     import scipy
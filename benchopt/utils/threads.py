@@ -0,0 +1,136 @@
+"""Control the number of threads and the CPUs used to run the solvers.
+
+The native thread pools, such as the ones of BLAS and OpenMP, are limited with
+``threadpoolctl``. The CPUs on which a process can run are set with
+``os.sched_setaffinity``, which is only available on Linux.
+"""
+import os
+from contextlib import contextmanager
+
+from threadpoolctl import threadpool_info, threadpool_limits
+
+
+# Function restoring the limits set by set_worker_thread_limits.
+_RESTORE_WORKER_LIMITS = None
+
+
+def get_cpus():
+    "Return the sorted list of the CPUs on which the current process can run."
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count()))
+
+
+def get_cpu_blocks(n_blocks):
+    """Split the CPUs available into ``n_blocks`` disjoint blocks.
+
+    This is used to pin the solvers run in parallel to different CPUs, so they
+    do not compete for the same cores.
+
+    Parameters
+    ----------
+    n_blocks : int
+        Number of blocks, i.e. of solvers run at the same time.
+
+    Returns
+    -------
+    cpu_blocks : list of list of int
+        Blocks of the same size, with the CPUs that do not fit left out.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        raise ValueError(
+            "Pinning the solvers to CPUs is only supported on Linux."
+        )
+    cpus = get_cpus()
+    block_size = len(cpus) // n_blocks
+    if block_size == 0:
+        raise ValueError(
+            f"Cannot pin {n_blocks} solvers run in parallel to different "
+            f"CPUs with only {len(cpus)} CPUs available."
+        )
+    return [
+        cpus[i * block_size:(i + 1) * block_size] for i in range(n_blocks)
+    ]
+
+
+def get_thread_counts():
+    """Return the number of threads used by the current process.
+
+    Returns
+    -------
+    thread_counts : dict
+        The number of CPUs the process can run on, as ``n_cpus``, and the
+        number of threads of the native thread pools loaded in the process,
+        by API, as ``n_threads_blas`` or ``n_threads_openmp``.
+    """
+    thread_counts = dict(n_cpus=len(get_cpus()))
+    for pool in threadpool_info():
+        key = f"n_threads_{pool['user_api']}"
+        thread_counts[key] = max(
+            thread_counts.get(key, 0), pool['num_threads']
+        )
+    return thread_counts
+
+
+def set_thread_limits(n_threads=None, cpus=None):
+    """Limit the threads and CPUs used by the current process.
+
+    Parameters
+    ----------
+    n_threads : int | None
+        Maximal number of threads of the native thread pools. If None, they
+        are not limited.
+    cpus : list of int | None
+        CPUs on which the process can run. If None, they are not changed.
+
+    Returns
+    -------
+    restore : callable
+        Function restoring the previous limits.
+    thread_counts : dict
+        The number of threads used with these limits, see
+        ``get_thread_counts``.
+    """
+    previous_cpus = None
+    if cpus is not None:
+        previous_cpus = get_cpus()
+        os.sched_setaffinity(0, cpus)
+    limiter = threadpool_limits(limits=n_threads)
+
+    def restore():
+        limiter.restore_original_limits()
+        if previous_cpus is not None:
+            os.sched_setaffinity(0, previous_cpus)
+
+    return restore, get_thread_counts()
+
+
+@contextmanager
+def limit_threads(n_threads=None, cpus=None):
+    """Context manager limiting the threads and CPUs used by the process.
+
+    See ``set_thread_limits`` for the parameters. It yields the number of
+    threads used with these limits.
+    """
+    restore, thread_counts = set_thread_limits(n_threads=n_threads, cpus=cpus)
+    try:
+        yield thread_counts
+    finally:
+        restore()
+
+
+def set_worker_thread_limits(n_threads=None, cpus=None, **state):
+    """Limit the threads and CPUs used by a worker process.
+
+    The limits are kept until the next call, which restores the previous ones
+    first. This is called with ``WorkerProcess.call``, which also passes the
+    objects of its ``state``, unused here.
+    """
+    global _RESTORE_WORKER_LIMITS
+
+    if _RESTORE_WORKER_LIMITS is not None:
+        _RESTORE_WORKER_LIMITS()
+    _RESTORE_WORKER_LIMITS, thread_counts = set_thread_limits(
+        n_threads=n_threads, cpus=cpus
+    )
+    return thread_counts